@@ -1,13 +1,17 @@
+import functools
 import inspect
 import re
+import sys
+import threading
 import time
-from typing import Any, Coroutine, List, Dict, Tuple
+from typing import Any, Awaitable, Callable, List, Dict, Tuple
 from pathlib import Path
 import asyncio
-from enum import Enum
+from enum import Enum, IntEnum
+from dataclasses import dataclass, field
 
-import keyboard
 from loguru import logger
+from rapidfuzz import fuzz
 from wizwalker import Client, ClientHandler, Primitive, Keycode
 
 from QuestDataNest import QuestDatabase
@@ -22,26 +26,249 @@ from wizwalker.memory.memory_objects.goal_data import GoalData, GoalType
 from paths import quest_name_path, advance_dialog_path, popup_title_path, spiral_door_teleport_path, \
     spiral_door_title_path, npc_range_path, popup_msgtext_path, dungeon_warning_path, spiral_door_exit_path, \
     decline_quest_path, dialog_text_path
-from utils import get_window_from_path, is_visible_by_path, click_window_by_path
-
-
-class PlayerState(Enum):
-    FREE = "free"
-    LOADING = "loading"
-    COMBAT = "combat"
-    DIALOGUE = "dialogue"
-    FORCED_ANIMATION = "forced_animation"
+from utils import get_window_from_path_or_none, is_visible_by_path, click_window_by_path
+
+try:
+    # Optional (pip install pyahocorasick), goal matching falls back to plain substring checks without it
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# partial_ratio a madlib value needs against the on-screen text to count in the fuzzy fallback
+_FUZZY_CUTOFF = 85
+
+# rapidfuzz abandons the alignment as soon as the cutoff is out of reach
+_partial_ratio = functools.partial(fuzz.partial_ratio, score_cutoff=_FUZZY_CUTOFF)
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_IN_ZONE_RE = re.compile(r'\s+in\s+([^\(]*)')
+_WS_RE = re.compile(r'\s+')
+# Dialogue keywords that suggest a quest offer worth accepting
+_QUEST_KW_RE = re.compile(r'quest|task|help|find|collect|defeat', re.IGNORECASE)
+
+# Lang keys resolve to the same text for the life of the game process
+_LANG_CACHE: dict[str, str] = {}
+_LANG_IN_FLIGHT: dict[str, asyncio.Future] = {}
+_LANG_CACHE_MAX = 4096
+
+# Indent strings for the detail printers (goal fields at 6, their tags/madlibs at 8)
+_INDENTS = {6: ' ' * 6, 8: ' ' * 8}
+
+# Resolved UI windows keyed by (process id, path); revalidated by name before reuse.
+# Only for windows that live as long as the HUD: popups and dialogue boxes are torn down and rebuilt, and a
+# freed or reused handle can still pass the name check, so those are always resolved fresh.
+_WINDOW_CACHE: dict[tuple[int, tuple[str, ...]], Any] = {}
+
+# paths.py exports mutable lists (utils copies and edits some), so freeze the one read through cached_window
+# once here; the tuple is then the cache key as-is instead of being rebuilt on every read
+_QUEST_NAME_PATH = tuple(quest_name_path)
+
+# One read coalescer per game process, keyed by process id
+_READ_COALESCERS: dict[int, 'ReadCoalescer'] = {}
+
+
+def _build_goal_handler_table(handler_names: Dict[GoalType, str]) -> Tuple[str | None, ...]:
+    table = [None] * (max(goal_type.value for goal_type in GoalType) + 1)
+    for goal_type, handler_name in handler_names.items():
+        table[goal_type.value] = handler_name
+    return tuple(table)
+
+
+@functools.lru_cache(maxsize=256)
+def _score_madlib_values(on_screen_text: str, madlib_values: Tuple[str, ...]) -> int:
+    return sum(1 for value in madlib_values if value and value in on_screen_text)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_madlib_automaton(values: frozenset[str]):
+    automaton = ahocorasick.Automaton()
+    for value in values:
+        automaton.add_word(value, value)
+    automaton.make_automaton()
+    return automaton
+
+
+@functools.lru_cache(maxsize=256)
+def _fuzzy_score_madlib_values(on_screen_text: str, madlib_values: Tuple[str, ...]) -> int:
+    return sum(1 for value in madlib_values if _partial_ratio(value, on_screen_text) >= _FUZZY_CUTOFF)
+
+
+def _find_on_screen_values(on_screen_text: str, madlib_value_lists: List[List[str]]) -> set[str] | None:
+    """Finds every madlib value present in the on-screen text with a single Aho-Corasick pass."""
+    if ahocorasick is None:
+        return None
+    values = frozenset(value for madlib_values in madlib_value_lists for value in madlib_values if value)
+    if not values:
+        return set()
+    # The candidate set only changes when goals complete, so the automaton is rebuilt rarely
+    automaton = _build_madlib_automaton(values)
+    return {value for _, value in automaton.iter(on_screen_text)}
+
+
+@functools.lru_cache(maxsize=64)
+def _class_layout(cls: type) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Splits a class's public names into (methods, properties) using static lookups only."""
+    methods, properties = [], []
+    for name in dir(cls):
+        if name.startswith('_'):
+            continue  # Skip private/protected
+        attr = inspect.getattr_static(cls, name)
+        if isinstance(attr, (staticmethod, classmethod)):
+            attr = attr.__func__
+        (methods if callable(attr) else properties).append(name)
+    return tuple(methods), tuple(properties)
+
+
+# Indexed by GoalType.value; unmapped slots fall back to _handle_unimplemented_goal.
+# Goal types that only need us standing at the goal location dispatch straight to travel.
+_GOAL_HANDLER_NAMES = _build_goal_handler_table({
+    GoalType.unknown: '_handle_unimplemented_goal',
+    GoalType.bounty: '_handle_defeat_goal',
+    GoalType.bountycollect: '_handle_defeat_goal',
+    GoalType.scavenge: '_travel_to_goal_location',
+    GoalType.persona: '_handle_persona_goal',
+    GoalType.waypoint: '_handle_waypoint_goal',
+    GoalType.scavengefake: '_travel_to_goal_location',
+    GoalType.achieverank: '_travel_to_goal_location',
+    GoalType.usage: '_handle_usage_goal',
+    GoalType.completequest: '_travel_to_goal_location',
+    GoalType.sociarank: '_travel_to_goal_location',
+    GoalType.sociacurrency: '_travel_to_goal_location',
+    GoalType.sociaminigame: '_travel_to_goal_location',
+    GoalType.sociagiveitem: '_travel_to_goal_location',
+    GoalType.sociagetitem: '_travel_to_goal_location',
+    GoalType.collectafterbounty: '_travel_to_goal_location',
+    GoalType.encounter_waypoint_foreach: '_travel_to_goal_location',
+})
+
+# Goal types handled as "travel, then wait for combat", with how each is described in the log
+_DEFEAT_GOAL_KINDS = {
+    GoalType.bounty: "Defeat",
+    GoalType.bountycollect: "Defeat and Collect",
+}
+
+
+class PlayerState(IntEnum):
+    FREE = 0
+    LOADING = 1
+    COMBAT = 2
+    DIALOGUE = 3
+    FORCED_ANIMATION = 4
+
+
+# Blocking states that only need waiting out: (log message, wait timeout)
+_STATE_WAITS = {
+    PlayerState.LOADING: ("Player in loading state - waiting...", 30.0),
+    PlayerState.COMBAT: ("Player in combat state - waiting...", 60.0),
+    PlayerState.FORCED_ANIMATION: ("Player in forced animation - waiting...", 15.0),
+}
+
+
+class TravelStep(Enum):
+    ARRIVED = "arrived"
+    ABORTED = "aborted"
+    RETRY = "retry"
+    FAILED = "failed"
+
+
+@dataclass
+class TravelState:
+    """Bookkeeping carried between travel steps; its methods hold the synchronous travel decisions"""
+    destination_zone: str
+    active_quest_id: Any
+    initial_goal_id: Any
+    initial_world: str
+    player_radius_offset: float = 1
+    failed_attempts: int = 0
+    max_failed_attempts: int = 10
+    # Zone the on-screen goal was last re-matched in
+    last_matched_zone: str = ""
+    # Static collision geometry built by WorldsCollideTP, reused across retries of this one travel
+    geometry_cache: dict = field(default_factory=dict)
+
+    # Minimum distance a teleport has to move us to count as progress, and its square for the comparison
+    MIN_PROGRESS_DISTANCE = 200
+    MIN_PROGRESS_DISTANCE_SQ = MIN_PROGRESS_DISTANCE * MIN_PROGRESS_DISTANCE
+
+    def switch_world(self, zone: str) -> bool:
+        """Tracks the world of zone and reports whether it differs from the last one seen."""
+        world = Utils.get_world_from_zone(zone)
+        switched = world != self.initial_world
+        self.initial_world = world
+        return switched
+
+    def reached_zone(self, zone: str):
+        """Resets the unstick offset after moving into zone."""
+        self.player_radius_offset = 1
+        self.initial_world = Utils.get_world_from_zone(zone)
+
+    def record_failure(self):
+        self.failed_attempts += 1
+        # Increase radius offset to avoid getting stuck in same location
+        self.player_radius_offset = min(self.player_radius_offset + 0.2, 1.5)
+
+    def judge_teleport(self, zone_before: str, zone_after: str, distance_moved_sq: float) -> TravelStep:
+        if zone_after != zone_before or distance_moved_sq > self.MIN_PROGRESS_DISTANCE_SQ:
+            self.reached_zone(zone_after)
+            return TravelStep.RETRY
+        return TravelStep.FAILED
+
+
+@dataclass
+class UIState:
+    """One round of UI visibility probes"""
+    popup: bool
+    npc_range: bool
+    spiral_door_open: bool
+    dialogue_advance: bool
+
+
+class ReadCoalescer:
+    """Lets concurrent callers share one in-flight or very recent read of the same named value."""
+
+    def __init__(self, ttl: float = 0.05):
+        self._ttl = ttl
+        self._reads: dict[str, Tuple[float, asyncio.Future]] = {}
+
+    async def get(self, name: str, read: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._reads.get(name)
+        now = time.monotonic()
+        if entry is None or (entry[1].done() and now - entry[0] >= self._ttl):
+            future = asyncio.ensure_future(read())
+            future.add_done_callback(lambda f: self._drop_failed(name, f))
+            entry = self._reads[name] = (now, future)
+        return await asyncio.shield(entry[1])
+
+    def _drop_failed(self, name: str, future: asyncio.Future):
+        # Failed reads are not worth sharing with later callers
+        if future.cancelled() or future.exception() is not None:
+            if self._reads.get(name, (None, None))[1] is future:
+                del self._reads[name]
+
+    def invalidate(self):
+        """Forgets every shared read so the next caller reads the client again; in-flight waiters keep theirs."""
+        self._reads.clear()
 
 
 class PlayerStateManager:
-    def __init__(self, client: Client):
+    def __init__(self, client: Client, cache_ttl: float = 0.1):
         self.client = client
+        # (monotonic timestamp, state) of the last full probe; reused for cache_ttl seconds
+        self._state_cache: Tuple[float, PlayerState | None] = (0.0, None)
+        self._cache_ttl = cache_ttl
+
+    def invalidate(self):
+        """Drops the cached state, and the client's shared reads, so the next read probes the client again."""
+        self._state_cache = (0.0, None)
+        Utils.invalidate_reads(self.client)
 
     async def read_dialogue_text(self) -> str:
+        # The dialogue box is rebuilt for every conversation, so never reuse a handle to it
+        dialogue_window = await get_window_from_path_or_none(self.client.root_window, dialog_text_path)
+        if dialogue_window is None:
+            return ""
         try:
-            dialogue_window = await get_window_from_path(self.client.root_window, dialog_text_path)
-            text = await dialogue_window.maybe_text()
-            return text if text else ""
+            return await dialogue_window.maybe_text() or ""
         except Exception:
             return ""
 
@@ -59,12 +286,27 @@ class PlayerStateManager:
         return dialogue_text != ""
 
     async def get_current_state(self) -> PlayerState:
-        if await self.is_in_loading():
+        cached_at, cached_state = self._state_cache
+        if cached_state is not None and time.monotonic() - cached_at < self._cache_ttl:
+            return cached_state
+        return await self._refresh_state()
+
+    async def _refresh_state(self) -> PlayerState:
+        state = await self._probe_state()
+        self._state_cache = (time.monotonic(), state)
+        return state
+
+    async def _probe_state(self) -> PlayerState:
+        # The cheap probes read independent memory/UI paths, so issue them together and decode by priority
+        loading, combat, dialogue = await asyncio.gather(
+            self.is_in_loading(), self.is_in_combat(), self.is_in_dialogue())
+        if loading:
             return PlayerState.LOADING
-        if await self.is_in_combat():
+        if combat:
             return PlayerState.COMBAT
-        if await self.is_in_dialogue():
+        if dialogue:
             return PlayerState.DIALOGUE
+        # The dialogue text read walks a window and copies a string, so only pay for it when nothing else matched
         if await self.has_dialogue_text():
             return PlayerState.FORCED_ANIMATION
         return PlayerState.FREE
@@ -75,50 +317,68 @@ class PlayerStateManager:
 
     async def wait_for_free_state(self, timeout: float = None):
         # TODO: If client ends combat and has dialog we just timeout I think and then continue maybe add logic here for that.
-        import time
-        start_time = time.time()
-        
-        while not await self.is_free():
-            if timeout and (time.time() - start_time) > timeout:
-                break
-            await asyncio.sleep(0.1)
+        # Back off while the state holds steady, but drop back to fast polling whenever it changes
+        # (e.g. loading -> dialogue) since the next transition is then likely close.
+        delay = start = 0.05
+        deadline = time.monotonic() + timeout if timeout else None
+        previous = None
+        # Probe fresh each round: the cache TTL is longer than the fastest poll interval and would hide the transition
+        while (state := await self._refresh_state()) != PlayerState.FREE:
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            delay = start if state != previous else min(0.5, delay * 1.5)
+            previous = state
+            await asyncio.sleep(delay)
+
+    async def _click_through_dialogue(self, max_clicks: int = 20):
+        # Most pages advance well inside 150ms; back off toward the old 500ms only if the button lingers
+        delays = (0.15, 0.25, 0.4)
+        for i in range(max_clicks):
+            if not await self.is_in_dialogue():
+                return
+            await click_window_by_path(self.client, advance_dialog_path)
+            # Wake as soon as the box closes instead of sleeping out the whole page delay
+            if await Utils.wait_while(self.is_in_dialogue, start=0.05, cap=0.1,
+                                      timeout=delays[i] if i < len(delays) else 0.5):
+                return
+        logger.warning(f"Dialogue still open after {max_clicks} clicks, giving up on advancing it.")
 
     async def handle_dialogue_safely(self) -> bool:
         if not await self.is_in_dialogue():
             return False
+        return await self.handle_open_dialogue()
 
+    async def handle_open_dialogue(self) -> bool:
+        """handle_dialogue_safely without the visibility check, for callers that just saw the dialogue open."""
         try:
             # Check if this is a quest-related dialogue
             dialogue_text = await self.read_dialogue_text()
             
             # If dialogue contains quest-related keywords, we might want to accept
-            quest_keywords = ["quest", "task", "help", "find", "collect", "defeat"]
-            should_accept = any(keyword in dialogue_text.lower() for keyword in quest_keywords)
+            should_accept = _QUEST_KW_RE.search(dialogue_text) is not None
             
             if should_accept:
                 # Accept the quest by clicking the right button (advance_dialog_path)
                 logger.info("Accepting dialogue/quest")
-                while await is_visible_by_path(self.client, advance_dialog_path):
-                    await click_window_by_path(self.client, advance_dialog_path)
-                    await asyncio.sleep(0.5)
+                await self._click_through_dialogue()
             else:
                 # Decline or exit dialogue by clicking the left button if available
                 if await is_visible_by_path(self.client, decline_quest_path):
                     logger.info("Declining dialogue/quest")
                     await click_window_by_path(self.client, decline_quest_path)
-                    await asyncio.sleep(0.5)
+                    await Utils.wait_while(self.is_in_dialogue, start=0.05, cap=0.1, timeout=0.5)
                 else:
                     # Just advance through if no decline option
                     logger.info("Advancing through dialogue")
-                    while await is_visible_by_path(self.client, advance_dialog_path):
-                        await click_window_by_path(self.client, advance_dialog_path)
-                        await asyncio.sleep(0.5)
+                    await self._click_through_dialogue()
 
             
             return True
         except Exception as e:
             logger.error(f"Error handling dialogue: {e}")
             return False
+        finally:
+            self.invalidate()
 
 
 class Utils:
@@ -127,83 +387,151 @@ class Utils:
     async def translate_lang_key(client: Client, lang_key: str) -> str:
         if not lang_key:
             return ""
+        cached = _LANG_CACHE.pop(lang_key, None)
+        if cached is not None:
+            # Re-insert so eviction order follows last use and the current quest's keys stay resident
+            _LANG_CACHE[lang_key] = cached
+            return cached
+
+        # Concurrent callers asking for the same key share a single memory read
+        pending = _LANG_IN_FLIGHT.get(lang_key)
+        if pending is None:
+            pending = asyncio.ensure_future(client.cache_handler.get_langcode_name(lang_key))
+            _LANG_IN_FLIGHT[lang_key] = pending
+            pending.add_done_callback(lambda _: _LANG_IN_FLIGHT.pop(lang_key, None))
         try:
-            return await client.cache_handler.get_langcode_name(lang_key)
+            translated = await asyncio.shield(pending)
         except Exception as e:
             logger.error(f"[UTILS] Error translating lang key '{lang_key}': {e}", exc_info=True)
             return lang_key
 
+        if len(_LANG_CACHE) >= _LANG_CACHE_MAX:
+            # dicts keep insertion order and hits re-insert, so this evicts the least recently used entry
+            del _LANG_CACHE[next(iter(_LANG_CACHE))]
+        _LANG_CACHE[lang_key] = translated
+        return translated
+
+    @staticmethod
+    async def cached_window(client: Client, path: tuple[str, ...]):
+        key = (client.process_id, path)
+        window = _WINDOW_CACHE.get(key)
+        if window is not None:
+            try:
+                if not path[-1] or await window.name() == path[-1]:
+                    return window
+            except Exception:
+                pass
+            # Stale handle (window was rebuilt or client restarted), walk the tree again
+            del _WINDOW_CACHE[key]
+
+        window = await get_window_from_path_or_none(client.root_window, path)
+        if window is not None:
+            _WINDOW_CACHE[key] = window
+        return window
+
+    @staticmethod
+    async def coalesced_read(client: Client, name: str, read: Callable[[], Awaitable[Any]]) -> Any:
+        coalescer = _READ_COALESCERS.get(client.process_id)
+        if coalescer is None:
+            coalescer = _READ_COALESCERS[client.process_id] = ReadCoalescer()
+        return await coalescer.get(name, read)
+
+    @staticmethod
+    def invalidate_reads(client: Client):
+        """Called after sending input, which can change anything a shared read holds."""
+        coalescer = _READ_COALESCERS.get(client.process_id)
+        if coalescer is not None:
+            coalescer.invalidate()
+
     @staticmethod
     async def get_on_screen_goal_text(client: Client) -> str:
-        try:
-            quest_name_window = await get_window_from_path(client.root_window, quest_name_path)
-            logger.info(f"On-screen goal text UI element found at base address: {hex(quest_name_window.base_address)}")
+        quest_name_window = await Utils.cached_window(client, _QUEST_NAME_PATH)
+        if quest_name_window is None:
+            return ""
+        logger.info(f"On-screen goal text UI element found at base address: {hex(quest_name_window.base_address)}")
 
+        try:
             raw_text = await quest_name_window.maybe_text()
-            if not raw_text:
-                return ""
-
-            clean_text = re.sub(r'<[^>]+>', '', raw_text)
-            clean_text = ' '.join(clean_text.split())
-            return clean_text
         except Exception as e:
             logger.error(f"Failed to read on-screen goal text: {e}")
             return ""
+        if not raw_text:
+            return ""
+
+        return _WS_RE.sub(' ', _TAG_RE.sub('', raw_text)).strip()
 
     @staticmethod
     async def get_quest_zone_name(c: Client) -> str:
         query = await Utils.read_quest_txt(c)
-        stopwords = ['<center>', '</center>']
-        querywords = query.split()
-        resultwords = [word for word in querywords if word.lower() not in stopwords]
-        s = ' '.join(resultwords)
-        res = re.findall(r"\s+in\s+([^\(]*)", s)
-        if len(res) == 0:
-            return ''
-        return res[0].strip()
+        # The quest text is only ever wrapped in <center> tags, plain replaces beat a regex pass
+        s = query.replace('<center>', '').replace('</center>', '')
+        match = _IN_ZONE_RE.search(_WS_RE.sub(' ', s).strip())
+        return match.group(1).strip() if match else ''
 
     @staticmethod
     async def read_quest_txt(client: Client) -> str:
+        quest_name = await Utils.cached_window(client, _QUEST_NAME_PATH)
+        if quest_name is None:
+            return ""
         try:
-            quest_name = await get_window_from_path(client.root_window, quest_name_path)
-            quest = await quest_name.maybe_text()
+            return await quest_name.maybe_text() or ""
         except Exception as e:
             logger.error(f"[UTILS] Error reading quest text: {e}", exc_info=True)
-            quest = ""
-        return quest
+            return ""
 
     @staticmethod
     async def read_spiral_door_title(client: Client) -> str:
+        title_text_path = await get_window_from_path_or_none(client.root_window, spiral_door_title_path)
+        if title_text_path is None:
+            return ""
         try:
-            title_text_path = await get_window_from_path(client.root_window, spiral_door_title_path)
-            title = await title_text_path.maybe_text()
+            return await title_text_path.maybe_text() or ""
         except Exception as e:
             logger.error(f"[UTILS] Error reading spiral door title: {e}", exc_info=True)
-            title = ""
-        return title
+            return ""
 
     @staticmethod
     async def read_popup_text(p: Client) -> str:
+        # NPCRangeWin comes and goes with every interaction prompt, so resolve it on each check
+        popup_text_path = await get_window_from_path_or_none(p.root_window, popup_msgtext_path)
+        if popup_text_path is None:
+            return ""
         try:
-            popup_text_path = await get_window_from_path(p.root_window, popup_msgtext_path)
-            txtmsg = await popup_text_path.maybe_text()
+            return await popup_text_path.maybe_text() or ""
         except Exception as e:
             logger.error(f"[UTILS] Error reading popup text: {e}", exc_info=True)
-            txtmsg = ""
-        return txtmsg
+            return ""
 
     @staticmethod
+    async def wait_while(condition: Callable[[], Awaitable[bool]], start: float = 0.02, cap: float = 0.25,
+                         timeout: float = None) -> bool:
+        """Polls condition with exponential backoff until it is false. Returns False if timeout elapsed first."""
+        delay = start
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while await condition():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(delay)
+            delay = min(cap, delay * 1.5)
+        return True
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
     def get_world_from_zone(zone_string: str) -> str:
-        if not zone_string or '/' not in zone_string:
+        if not zone_string:
             return zone_string
-        return zone_string.split('/')[0]
+        slash = zone_string.find('/')
+        return zone_string if slash < 0 else zone_string[:slash]
     # </editor-fold>
 
 
 class BestQuest:
-    def __init__(self, client: Client, clients: list[Client], db_logger: QuestDatabase, all_quest_data=None):
+    def __init__(self, client: Client, clients: list[Client], db_logger: QuestDatabase, all_quest_data=None,
+                 debug_pause: bool = False, debug_inspect: bool = False):
         self.client = client
         self.db_logger = db_logger
+        self.debug_pause = debug_pause # Pause for Enter before each handler (quest auditing)
+        self.debug_inspect = debug_inspect # Dump every quest/goal object's fields and methods (research only)
         self.state_manager = PlayerStateManager(client)
         self.last_sigil_exit_time = 0 # Track when we last exited a sigil
         self.sigil_grace_period = 5 # seconds to avoid re-entering immediately
@@ -215,131 +543,155 @@ class BestQuest:
         self.current_goal_id = None
         self.current_goal_type = None
 
-        self.goal_handlers = {
-            GoalType.unknown: self._handle_unimplemented_goal,
-            GoalType.bounty: self._handle_bounty_goal,
-            GoalType.bountycollect: self._handle_bountycollect_goal,
-            GoalType.scavenge: self._handle_scavenge_goal,
-            GoalType.persona: self._handle_persona_goal,
-            GoalType.waypoint: self._handle_waypoint_goal,
-            GoalType.scavengefake: self._handle_scavengefake_goal,
-            GoalType.achieverank: self._handle_achieverank_goal,
-            GoalType.usage: self._handle_usage_goal,
-            GoalType.completequest: self._handle_completequest_goal,
-            GoalType.sociarank: self._handle_sociarank_goal,
-            GoalType.sociacurrency: self._handle_sociacurrency_goal,
-            GoalType.sociaminigame: self._handle_sociaminigame_goal,
-            GoalType.sociagiveitem: self._handle_sociagiveitem_goal,
-            GoalType.sociagetitem: self._handle_sociagetitem_goal,
-            GoalType.collectafterbounty: self._handle_collectafterbounty_goal,
-            GoalType.encounter_waypoint_foreach: self._handle_encounter_waypoint_foreach_goal
-        }
+        # Translated madlib values per (goal id, goal address); madlib text never changes for a live goal
+        self._madlib_cache: dict[tuple[int, int], List[str]] = {}
+        # Goal types by goal address; a goal's type is fixed for its lifetime
+        self._goal_type_cache: dict[int, GoalType] = {}
+        # Goal id matched per (on-screen text, goal id set); the player flips between a few goal texts per quest
+        self._goal_matches: dict[tuple[str, frozenset[int]], int] = {}
+        # Fingerprint of what was last written to the database per quest id
+        self._logged_quests: dict[int, int] = {}
 
     # <editor-fold desc="Database and Print Helpers">
     async def log_full_quest_to_db(self, quest_to_log: QuestData, quest_id: int):
         if not self.db_logger: return
         logger.info(f"Logging full data for Quest ID {quest_id} to the database...")
         try:
-            await self.db_logger.log_quest(self.client, quest_to_log, quest_id)
             all_goals = await quest_to_log.goal_data()
-            for goal_id, goal in all_goals.items():
-                await self.db_logger.log_goal(self.client, goal, goal_id, quest_id)
+            # Rows only change as goals complete, so skip the rewrite while ids and statuses match
+            statuses = await asyncio.gather(*(goal.goal_status() for goal in all_goals.values()))
+            fingerprint = hash((tuple(all_goals), tuple(statuses)))
+            if self._logged_quests.get(quest_id) == fingerprint:
+                logger.debug(f"Quest ID {quest_id} unchanged since last database write, skipping.")
+                return
+
+            await self.db_logger.log_quest(self.client, quest_to_log, quest_id)
+            # Goals are independent rows; overlap their memory reads, bounded to keep the client responsive
+            sem = asyncio.Semaphore(8)
+
+            async def log_goal(goal_id: int, goal: GoalData):
+                async with sem:
+                    await self.db_logger.log_goal(self.client, goal, goal_id, quest_id)
+
+            results = await asyncio.gather(*(log_goal(goal_id, goal) for goal_id, goal in all_goals.items()),
+                                           return_exceptions=True)
+            failed = [(goal_id, result) for goal_id, result in zip(all_goals, results) if isinstance(result, Exception)]
+            for goal_id, error in failed:
+                logger.error(f"Failed to log goal {goal_id} of quest {quest_id} to database: {error}")
+            if failed:
+                # Leave the fingerprint stale so the next pass retries the missing goals
+                return
+            self._logged_quests[quest_id] = fingerprint
             logger.success(f"Successfully logged Quest ID {quest_id} to the database.")
         except Exception as e:
             logger.error(f"Failed to log quest {quest_id} to database: {e}", exc_info=True)
 
     async def _print_quest_details(self, quest: QuestData, quest_id: int, client: Client):
-        print("\n" + "=" * 60)
-        print(
-            f"Quest: {await Utils.translate_lang_key(self.client, await quest.name_lang_key())} (ID: {quest_id})\n"
-            f"  Raw Key: {await quest.name_lang_key()}\n"
-            f"  Ready To Turn in: {await quest.ready_to_turn_in()}\n"
-            f"  Activity Type: {await quest.activity_type()}\n"
-            f"  Quest Type: {await quest.quest_type()}\n"
-            f"  Quest Level: {await quest.quest_level()}\n"
-            f"  Quest Arrow: {await quest.permit_quest_helper()}\n"
-            f"  Mainline Quest: {await quest.mainline()}\n"
-            f"  Pet Only: {await quest.pet_only_quest()}"
-        )
+        name_key, ready, activity_type, quest_type, quest_level, quest_arrow, mainline, pet_only = await asyncio.gather(
+            quest.name_lang_key(), quest.ready_to_turn_in(), quest.activity_type(), quest.quest_type(),
+            quest.quest_level(), quest.permit_quest_helper(), quest.mainline(), quest.pet_only_quest())
+        translated_name = await Utils.translate_lang_key(self.client, name_key)
+
+        # The whole tree is buffered and written once at the end
+        out = [
+            "",
+            "=" * 60,
+            f"Quest: {translated_name} (ID: {quest_id})",
+            f"  Raw Key: {name_key}",
+            f"  Ready To Turn in: {ready}",
+            f"  Activity Type: {activity_type}",
+            f"  Quest Type: {quest_type}",
+            f"  Quest Level: {quest_level}",
+            f"  Quest Arrow: {quest_arrow}",
+            f"  Mainline Quest: {mainline}",
+            f"  Pet Only: {pet_only}",
+        ]
 
         # Add complete quest inspection for research
-        logger.warning("[QUEST_DETAILS] Performing complete quest object inspection for research...")
-        await self._inspect_object_completely(quest, f"QuestData_Details_{quest_id}", 0)
+        if self.debug_inspect:
+            logger.warning("[QUEST_DETAILS] Performing complete quest object inspection for research...")
+            await self._inspect_object_completely(quest, f"QuestData_Details_{quest_id}", 0)
 
         quest_goals = await quest.goal_data()
-        print("  Goals:")
+        out.append("  Goals:")
         if not quest_goals:
-            print("    (No goals found for this quest)")
+            out.append("    (No goals found for this quest)")
         else:
             for goal_id, goal in quest_goals.items():
                 display_goal_id = goal_id & 0xFFFFFFFF
-                print(f"    - Goal ID: {display_goal_id} (Full: {goal_id})")
-                await self._print_goal_details(goal, indent=6)
+                out.append(f"    - Goal ID: {display_goal_id} (Full: {goal_id})")
+                await self._print_goal_details(goal, indent=6, out=out)
                 
                 # Add complete goal inspection for research
-                logger.warning(f"[QUEST_DETAILS] Performing complete goal object inspection for goal {goal_id}...")
-                await self._inspect_object_completely(goal, f"GoalData_Details_{goal_id}", 0)
-
-        print("=" * 60)
-
-    async def _print_goal_details(self, goal: GoalData, indent: int):
-        indent_str = ' ' * indent
-        print(
-            f"{indent_str}Raw Name: {await goal.name_lang_key()}\n"
-            f"{indent_str}Translated Name: {await Utils.translate_lang_key(self.client, await goal.name_lang_key())}\n"
-            f"{indent_str}Status: {'Complete' if await goal.goal_status() else 'Incomplete'}\n"
-            f"{indent_str}Destination Zone: {await goal.goal_destination_zone()}\n"
-            f"{indent_str}Type: {await goal.goal_type()}\n"
-        )
-        client_tags = await goal.client_tag_list()
+                if self.debug_inspect:
+                    logger.warning(f"[QUEST_DETAILS] Performing complete goal object inspection for goal {goal_id}...")
+                    await self._inspect_object_completely(goal, f"GoalData_Details_{goal_id}", 0)
+
+        out.append("=" * 60)
+        out.append("")
+        sys.stdout.write('\n'.join(out))
+
+    async def _print_goal_details(self, goal: GoalData, indent: int, out: list[str]):
+        indent_str = _INDENTS.get(indent) or ' ' * indent
+        name_key, status, destination_zone, goal_type, client_tags, madlib = await asyncio.gather(
+            goal.name_lang_key(), goal.goal_status(), goal.goal_destination_zone(), goal.goal_type(),
+            goal.client_tag_list(), goal.madlib_block())
+        translated_name = await Utils.translate_lang_key(self.client, name_key)
+        out += [
+            f"{indent_str}Raw Name: {name_key}",
+            f"{indent_str}Translated Name: {translated_name}",
+            f"{indent_str}Status: {'Complete' if status else 'Incomplete'}",
+            f"{indent_str}Destination Zone: {destination_zone}",
+            f"{indent_str}Type: {goal_type}",
+            "",
+        ]
         if client_tags:
-            await self._print_client_tags(client_tags, indent + 2)
+            await self._print_client_tags(client_tags, indent + 2, out)
             # Deep ClientTagList inspection
-            logger.warning(f"[GOAL_DETAILS] Performing complete ClientTagList inspection...")
-            await self._inspect_object_completely(client_tags, f"ClientTagList_GoalDetails", indent // 2)
-            
-        madlib = await goal.madlib_block()
+            if self.debug_inspect:
+                logger.warning(f"[GOAL_DETAILS] Performing complete ClientTagList inspection...")
+                await self._inspect_object_completely(client_tags, f"ClientTagList_GoalDetails", indent // 2)
+
         if madlib:
-            await self._print_madlib_block(madlib, indent + 2)
+            await self._print_madlib_block(madlib, indent + 2, out)
             # Deep MadlibBlock inspection  
-            logger.warning(f"[GOAL_DETAILS] Performing complete MadlibBlock inspection...")
-            await self._inspect_object_completely(madlib, f"MadlibBlock_GoalDetails", indent // 2)
+            if self.debug_inspect:
+                logger.warning(f"[GOAL_DETAILS] Performing complete MadlibBlock inspection...")
+                await self._inspect_object_completely(madlib, f"MadlibBlock_GoalDetails", indent // 2)
 
-    async def _print_client_tags(self, client_tag_list: ClientTagList, indent: int):
-        indent_str = ' ' * indent
+    async def _print_client_tags(self, client_tag_list: ClientTagList, indent: int, out: list[str]):
+        indent_str = _INDENTS.get(indent) or ' ' * indent
         try:
             tags = await client_tag_list.client_tags()
             if tags:
-                print(f"{indent_str}Client Tags:")
-                for i, tag in enumerate(tags):
-                    print(f"{indent_str}  - {tag}")
+                out.append(f"{indent_str}Client Tags:")
+                out.extend(f"{indent_str}  - {tag}" for tag in tags)
         except Exception as e:
             logger.error(f"Could not read ClientTagList: {e}")
 
-    async def _print_madlib_block(self, madlib_block: MadlibBlock, indent: int):
-        indent_str = ' ' * indent
+    async def _print_madlib_block(self, madlib_block: MadlibBlock, indent: int, out: list[str]):
+        indent_str = _INDENTS.get(indent) or ' ' * indent
         if not madlib_block:
             return
-        print(f"{indent_str}MadlibBlock Entries:")
+        out.append(f"{indent_str}MadlibBlock Entries:")
         entries = await madlib_block.entries()
         for entry in entries:
-            identifier = await entry.identifier()
-            sub_quest_info_string = await entry.maybe_data_str()
+            identifier, sub_quest_info_string = await asyncio.gather(entry.identifier(), entry.maybe_data_str())
             final_sub_quest_info_string = await Utils.translate_lang_key(self.client, sub_quest_info_string) if sub_quest_info_string else None
-            print(f"{indent_str}  - Identifier: {identifier}")  # identifier is a field name, not a lang key
-            print(f"{indent_str}    Final Value: {final_sub_quest_info_string or 'Empty'}")
+            out.append(f"{indent_str}  - Identifier: {identifier}")  # identifier is a field name, not a lang key
+            out.append(f"{indent_str}    Final Value: {final_sub_quest_info_string or 'Empty'}")
 
     # </editor-fold>
 
     # <editor-fold desc="Action Handlers">
 
-    async def _handle_dialogue(self) -> bool:
+    async def _handle_dialogue(self, snapshot: UIState = None) -> bool:
         logger.debug("[DIALOGUE] Starting dialogue handling")
         
         # Small delay to catch any dialogue that might be appearing
         await asyncio.sleep(0.2)
 
-        current_time = time.time()
+        current_time = time.monotonic()
 
         # Always apply NPC dialogue cooldown if an interaction was just handled,
         # regardless of zone comparison for the *current* goal.
@@ -350,35 +702,42 @@ class BestQuest:
             return False  # Indicate that we are intentionally skipping this interaction
 
         # Check for sigil entry dialog first
-        if await is_visible_by_path(self.client, npc_range_path):
+        if snapshot.npc_range if snapshot else await is_visible_by_path(self.client, npc_range_path):
             popup_text = await Utils.read_popup_text(self.client)
             if "to enter" in popup_text.lower():
                 logger.warning("Sigil dialog detected - handling sigil entry...")
-                handled_sigil = await self._handle_sigil_entry()
+                handled_sigil = await self._act_sigil_entry()
                 if handled_sigil:
-                    self.last_npc_dialogue_handled_time = time.time()  # Update timestamp after successful sigil handling
+                    self.last_npc_dialogue_handled_time = time.monotonic()  # Update timestamp after successful sigil handling
                 return handled_sigil
 
         # Handle initial NPC interaction pop-up (pressing 'X')
         # This is the prompt to initiate dialogue with an NPC
-        if await is_visible_by_path(self.client, popup_title_path):
+        popup_open = snapshot.popup if snapshot else await is_visible_by_path(self.client, popup_title_path)
+        if popup_open:
             logger.warning("Initial NPC interaction pop-up detected. Pressing 'X' to engage.")
             await self.client.send_key(Keycode.X, 0.1)
-            await asyncio.sleep(1.0)
+            self.state_manager.invalidate()
+
+            async def dialogue_not_open() -> bool:
+                return not await self.state_manager.is_in_dialogue()
+
+            await Utils.wait_while(dialogue_not_open, start=0.05, cap=0.3, timeout=1.0)
             # After pressing X, it's very likely to go into dialogue.
             # We will update last_npc_dialogue_handled_time upon successful dialogue handling.
 
         # Now check for actual dialogue being present (the larger dialogue window)
-        if await self.state_manager.is_in_dialogue():
+        # Pressing X above changes the UI, so only trust the snapshot when nothing was pressed
+        if snapshot.dialogue_advance if snapshot and not popup_open else await self.state_manager.is_in_dialogue():
             logger.warning("Dialogue detected - handling safely...")
             
             # Check for quest changes before dialogue handling
             await self._check_quest_goal_changes("before_dialogue_handling")
             
-            handled = await self.state_manager.handle_dialogue_safely()
+            handled = await self.state_manager.handle_open_dialogue()
             if handled:
                 logger.success("Dialogue handled successfully.")
-                self.last_npc_dialogue_handled_time = time.time()  # Update timestamp after successful dialogue
+                self.last_npc_dialogue_handled_time = time.monotonic()  # Update timestamp after successful dialogue
                 
                 # Check for quest changes after dialogue handling
                 if await self._check_quest_goal_changes("after_dialogue_handling"):
@@ -389,11 +748,37 @@ class BestQuest:
         logger.debug("[DIALOGUE] No dialogue to handle")
         return False
 
+    async def _probe_sigil(self) -> bool:
+        return await is_visible_by_path(self.client, npc_range_path)
+
+    async def _probe_spiral_door(self) -> bool:
+        return await is_visible_by_path(self.client, spiral_door_teleport_path)
+
+    async def _ui_snapshot(self) -> UIState:
+        popup, npc_range, spiral_door_open, dialogue_advance = await asyncio.gather(
+            is_visible_by_path(self.client, popup_title_path), is_visible_by_path(self.client, npc_range_path),
+            is_visible_by_path(self.client, spiral_door_teleport_path), self.state_manager.is_in_dialogue())
+        return UIState(popup, npc_range, spiral_door_open, dialogue_advance)
+
+    async def _handle_zoning_ui(self, destination_zone: str, current_zone: str = None,
+                                snapshot: UIState = None) -> bool:
+        # The visibility probes are independent reads; only the actions are mutually exclusive
+        if snapshot:
+            spiral_open, sigil_open = snapshot.spiral_door_open, snapshot.npc_range
+        else:
+            spiral_open, sigil_open = await asyncio.gather(self._probe_spiral_door(), self._probe_sigil())
+        ui_handled = spiral_open and await self._act_spiral_door(destination_zone, current_zone)
+        if not ui_handled and sigil_open:
+            ui_handled = await self._act_sigil_entry(current_zone)
+        return ui_handled
+
     async def _handle_sigil_entry(self) -> bool:
         # Check if the sigil UI is even visible
-        if not await is_visible_by_path(self.client, npc_range_path):
+        if not await self._probe_sigil():
             return False
+        return await self._act_sigil_entry()
 
+    async def _act_sigil_entry(self, current_zone: str = None) -> bool:
         # Read popup text to determine context
         popup_text = await Utils.read_popup_text(self.client)
         if "to enter" not in popup_text.lower():
@@ -403,60 +788,28 @@ class BestQuest:
         logger.warning("Dungeon sigil entry dialog detected.")
 
         # --- NEW LOGIC: Prevent immediate re-entry after recent exit ---
-        current_time = asyncio.get_event_loop().time()
+        current_time = time.monotonic()
         if current_time - self.last_sigil_exit_time < self.sigil_grace_period:
-            # Check if player has moved far enough from where they exited
-            player_pos = await self.client.body.position()
-            # You would need to store the exit position from the sigil
-            # For now, let's assume if it's within the grace period, we just skip re-entry
-            # A more robust solution would store the exit location and check distance from it.
             logger.info(f"Within sigil grace period ({self.sigil_grace_period}s). Skipping re-entry attempt.")
             return False  # Indicate that we saw the UI but chose not to act
 
-        # --- Your Proposed Radius Check (incorporating quest goal context) ---
-        quest_manager = await self.client.quest_manager()
-        character_registry = await self.client.character_registry()
-        active_quest_id = await character_registry.active_quest_id()
+        # --- Only enter when the active goal leads somewhere else ---
+        active_quest_id, active_quest, all_goals = await self._active_quest_snapshot()
 
         if active_quest_id:
-            all_quests = await quest_manager.quest_data()
-            active_quest = all_quests.get(active_quest_id)
             if active_quest:
                 on_screen_text = await Utils.get_on_screen_goal_text(self.client)
-                all_goals = await active_quest.goal_data()
                 identified_goal_id, identified_goal = await self._find_goal_by_text_matching(on_screen_text, all_goals)
 
                 if identified_goal:
-                    quest_target_pos = await self.client.quest_position.position()  # This is the main quest position
-                    player_pos = await self.client.body.position()
-
-                    # Define a "near sigil" radius - needs tuning
-                    # This could be the player's interaction range or a bit larger
-                    sigil_interaction_radius = 500  # Example value, adjust as needed
-
-                    distance_to_quest_target = ((player_pos.x - quest_target_pos.x) ** 2 + 
-                                               (player_pos.y - quest_target_pos.y) ** 2) ** 0.5
-
-                    # Check if the quest goal requires entering a sigil (e.g., goal_type, or specific madlib text)
-                    # For simplicity, let's assume if the player is far from the target, and we are at a sigil UI, we should enter.
-                    # Or, more precisely, if the QUEST TARGET is still *inside* the dungeon the sigil leads to.
-                    # This might require pre-mapping zones to their sigils.
-
-                    # A more direct check: if the *current goal's destination zone* is different from the current zone, AND the quest target
-                    # is "close enough" to the sigil UI, then it's likely we need to enter.
                     goal_dest_zone = await identified_goal.goal_destination_zone()
-                    current_zone = await self.client.zone_name()
+                    if current_zone is None:
+                        current_zone = await self.client.zone_name()
 
                     # If goal destination zone is different from current zone, we likely need to enter
-                    # AND the quest target is within a reasonable distance to the sigil (which is where the player is).
-                    # This assumes quest_position points to something inside the sigil when you need to enter.
                     if goal_dest_zone and goal_dest_zone != current_zone:
                         logger.info(
                             f"Current goal destination zone ('{goal_dest_zone}') differs from current zone ('{current_zone}').")
-                        # Here, you might also want to check if quest_target_pos is within the known bounds of the sigil itself
-                        # but for now, rely on the simple distance to player
-                        # A more advanced check: if the target_pos is in a known "dungeon zone" and player is outside
-                        pass  # Proceed to enter sigil logic below
                     else:
                         logger.warning(
                             f"Sigil UI detected, but current goal destination ('{goal_dest_zone}') is same as current zone ('{current_zone}'). Skipping re-entry.")
@@ -470,33 +823,38 @@ class BestQuest:
 
         logger.info("Attempting to enter sigil...")
         await self.client.send_key(Keycode.X, 0.1)
-        await asyncio.sleep(1.0)  # Give it a moment for the warning/loading screen
+        self.state_manager.invalidate()
+
+        # Give it a moment for the warning/loading screen
+        async def entry_pending() -> bool:
+            warning_open, loading = await asyncio.gather(
+                is_visible_by_path(self.client, dungeon_warning_path), self.client.is_loading())
+            return not (warning_open or loading)
+
+        await Utils.wait_while(entry_pending, start=0.05, cap=0.3, timeout=1.0)
 
         if await is_visible_by_path(self.client, dungeon_warning_path):
             logger.info("Confirming dungeon entry...")
             await click_window_by_path(self.client, dungeon_warning_path)
+            self.state_manager.invalidate()
             await asyncio.sleep(0.5)
 
         logger.info("Waiting for zone change after entering sigil...")
         zone_before_loading = await self.client.zone_name()
 
         # Wait for the loading screen to appear and then disappear
-        start_wait_time = asyncio.get_event_loop().time()
-        while not await self.client.is_loading():
-            if asyncio.get_event_loop().time() - start_wait_time > 20:  # Timeout for loading screen to appear
-                logger.warning("Loading screen did not appear after sigil entry attempt. Assume failed or already in.")
-                return False
-            await asyncio.sleep(0.1)
+        if not await self._await_loading(True, timeout=20):  # Timeout for loading screen to appear
+            logger.warning("Loading screen did not appear after sigil entry attempt. Assume failed or already in.")
+            return False
 
-        while await self.client.is_loading():
-            await asyncio.sleep(0.1)
+        await self._await_loading(False)
 
         # After loading, check if the zone actually changed
         zone_after_loading = await self.client.zone_name()
         if zone_after_loading != zone_before_loading:
             logger.success(f"Entered dungeon: Zone changed from '{zone_before_loading}' to '{zone_after_loading}'.")
             # Store the current time as the last sigil exit time to prevent immediate re-entry if we exit soon
-            self.last_sigil_exit_time = asyncio.get_event_loop().time()
+            self.last_sigil_exit_time = time.monotonic()
             # Also store current position to check distance moved if grace period is active
             self.last_sigil_exit_pos = await self.client.body.position()
             return True
@@ -509,9 +867,7 @@ class BestQuest:
         logger.warning(f"Advanced portal logic for location '{location_name}' is not yet implemented.")
         pass
 
-    async def _handle_spiral_door(self, destination_zone: str) -> bool:
-        if not await is_visible_by_path(self.client, spiral_door_teleport_path):
-            return False
+    async def _act_spiral_door(self, destination_zone: str, current_zone: str = None) -> bool:
         ''' HANDEL "WAIT TRY AGIAN IN A SECOND WIZARD"
 -- [MessageBoxModalWindow] Window
 --- [messageBoxBG] Window
@@ -531,7 +887,9 @@ class BestQuest:
 ------ [CancelBtn] ControlButton'''
         logger.info("Spiral Door UI is open. Checking if travel is needed...")
 
-        current_world = Utils.get_world_from_zone(await self.client.zone_name())
+        if current_zone is None:
+            current_zone = await self.client.zone_name()
+        current_world = Utils.get_world_from_zone(current_zone)
         destination_world = Utils.get_world_from_zone(destination_zone)
 
         if current_world == destination_world:
@@ -549,8 +907,7 @@ class BestQuest:
             await click_window_by_path(self.client, spiral_door_teleport_path, True)
 
         logger.info("Waiting for world travel to complete...")
-        while await self.client.is_loading():
-            await asyncio.sleep(0.2)
+        await self._await_loading(False)
         
         # Wait additional time for any post-teleport dialogue to appear
         await asyncio.sleep(1.5)
@@ -560,6 +917,14 @@ class BestQuest:
     # </editor-fold>
 
     # <editor-fold desc="Player State Helpers">
+    async def _await_loading(self, loading: bool, timeout: float = None) -> bool:
+        """Waits until the client's loading state equals loading. Returns False if timeout elapsed first."""
+        async def pending() -> bool:
+            return await self.client.is_loading() != loading
+
+        # Loading screens last seconds, so settle toward 0.5s polls rather than reading 10x a second
+        return await Utils.wait_while(pending, start=0.05, cap=0.5, timeout=timeout)
+
     async def _wait_for_free_state(self, timeout: float = 10.0) -> bool:
         await self.state_manager.wait_for_free_state(timeout)
         return await self.state_manager.is_free()
@@ -569,237 +934,65 @@ class BestQuest:
         
         if current_state == PlayerState.DIALOGUE:
             logger.info(f"Player in dialogue state - handling...")
-            return await self.state_manager.handle_dialogue_safely()
-        elif current_state == PlayerState.LOADING:
-            logger.info("Player in loading state - waiting...")
-            await self.state_manager.wait_for_free_state(timeout=30.0)
-            return True
-        elif current_state == PlayerState.COMBAT:
-            logger.info("Player in combat state - waiting...")
-            await self.state_manager.wait_for_free_state(timeout=60.0)
-            return True
-        elif current_state == PlayerState.FORCED_ANIMATION:
-            logger.info("Player in forced animation - waiting...")
-            await self.state_manager.wait_for_free_state(timeout=15.0)
+            return await self.state_manager.handle_open_dialogue()
+
+        wait = _STATE_WAITS.get(current_state)
+        if wait:
+            message, timeout = wait
+            logger.info(message)
+            await self.state_manager.wait_for_free_state(timeout=timeout)
             return True
         
         return current_state == PlayerState.FREE
 
     async def _wait_for_combat_start(self, timeout: float = 10.0) -> bool:
-        import time
-        start_time = time.time()
-        
+        async def not_in_combat() -> bool:
+            return not await self.state_manager.is_in_combat()
+
         logger.info(f"Waiting for player to enter combat (timeout: {timeout}s)...")
-        while time.time() - start_time < timeout:
-            if await self.state_manager.is_in_combat():
-                logger.success("Player entered combat!")
-                return True
-            await asyncio.sleep(0.1)
-        
+        if await Utils.wait_while(not_in_combat, cap=0.2, timeout=timeout):
+            logger.success("Player entered combat!")
+            return True
+
         logger.warning(f"Player did not enter combat within {timeout} seconds.")
         return False
 
     # </editor-fold>
 
     # <editor-fold desc="Movement Logic">
-    async def _travel_to_goal_location(self, goal: GoalData):
+    async def _travel_to_goal_location(self, goal: GoalData, timeout: float = 300.0):
         destination_zone = await goal.goal_destination_zone()
-        max_failed_attempts = 10
-        failed_attempts = 0
         # Get the actual goal ID from the quest system for proper tracking
-        quest_manager = await self.client.quest_manager()
-        character_registry = await self.client.character_registry()
-        active_quest_id = await character_registry.active_quest_id()
+        active_quest_id, active_quest, all_goals = await self._active_quest_snapshot()
         initial_goal_id = None
-        if active_quest_id:
-            all_quests = await quest_manager.quest_data()
-            active_quest = all_quests.get(active_quest_id)
-            if active_quest:
-                all_goals = await active_quest.goal_data()
-                for goal_id, quest_goal in all_goals.items():
-                    if quest_goal == goal:
-                        initial_goal_id = goal_id
-                        break
-        player_radius_offset = 1  # Start with default radius
-        
-        # Initialize position tracking for progress detection
-        position_before_action = await self.client.body.position()
-        
-        # Track if we just switched worlds to avoid unnecessary UI handling
-        initial_world = Utils.get_world_from_zone(await self.client.zone_name())
-        just_switched_worlds = False
-
-        while failed_attempts < max_failed_attempts:
-            # Check for quest/goal changes at the start of each travel loop
-            if await self._check_quest_goal_changes(f"travel_loop_start_attempt_{failed_attempts + 1}"):
-                logger.warning("[TRAVEL] Quest/goal changes detected in travel loop, exiting travel")
-                break
-            
-            current_zone = await self.client.zone_name()
-            if not current_zone:
-                await asyncio.sleep(0.5)
-                continue
-
-            logger.info(
-                f"Travel Loop | Attempt [{failed_attempts + 1}/{max_failed_attempts}] | Destination: '{destination_zone}' | Current: '{current_zone}' | Radius Offset: {player_radius_offset}")
-
-            # Check if we've reached the destination zone
-            if current_zone == destination_zone:
-                logger.success("Player is in the correct zone.")
-                break
-
-            # Check if goal has changed (quest progression) by re-checking active quest
-            if initial_goal_id:
-                current_quest_id = await character_registry.active_quest_id()
-                if current_quest_id != active_quest_id:
-                    logger.info("Active quest has changed during travel, exiting travel loop.")
-                    break
-                
-                # Also check if the current goal is still active by re-matching on-screen text
-                current_on_screen_text = await Utils.get_on_screen_goal_text(self.client)
-                if current_on_screen_text:
-                    current_quests = await quest_manager.quest_data()
-                    current_active_quest = current_quests.get(current_quest_id)
-                    if current_active_quest:
-                        current_goals = await current_active_quest.goal_data()
-                        current_identified_goal_id, current_identified_goal = await self._find_goal_by_text_matching(current_on_screen_text, current_goals)
-                        if current_identified_goal_id and current_identified_goal_id != initial_goal_id:
-                            logger.info(f"Goal has changed from {initial_goal_id} to {current_identified_goal_id}, exiting travel loop.")
-                            break
-
-            zone_before_action = current_zone
-            position_before_action = await self.client.body.position()
-
-            # Check if we just switched worlds in this loop iteration
-            current_world = Utils.get_world_from_zone(current_zone)
-            if current_world != initial_world:
-                just_switched_worlds = True
-                initial_world = current_world
-                logger.info(f"Detected world switch to '{current_world}'. Skipping initial UI handling to avoid reopening spiral door.")
-            else:
-                just_switched_worlds = False
-            
-            # FIRST: Check player state and handle any blocking conditions
-            if not just_switched_worlds:
-                # Wait for player to be in a free state before proceeding
-                await self._wait_for_free_state(timeout=10.0)
-                
-                # Check and handle current player state
-                state_handled = await self._check_and_handle_player_state()
-                
-                # Handle UI elements
-                dialogue_handled = await self._handle_dialogue()
-                ui_handled = dialogue_handled or await self._handle_spiral_door(destination_zone)
-                if not ui_handled:
-                    ui_handled = await self._handle_sigil_entry()
-                
-                # Check again for dialogue after UI interactions if no sigil was handled
-                if not dialogue_handled:
-                    await self._handle_dialogue()
-            else:
-                # If we just switched worlds, we still need to track ui_handled for logic flow
-                ui_handled = False
-                logger.info("Skipped UI handling due to recent world switch. Proceeding directly to teleportation.")
+        if active_quest:
+            # Match on the underlying object address instead of comparing goal proxies
+            goal_base = goal.base_address
+            initial_goal_id = next(
+                (goal_id for goal_id, quest_goal in all_goals.items() if quest_goal.base_address == goal_base), None)
+
+        state = TravelState(
+            destination_zone=destination_zone,
+            active_quest_id=active_quest_id,
+            initial_goal_id=initial_goal_id,
+            # Track if we just switched worlds to avoid unnecessary UI handling
+            initial_world=Utils.get_world_from_zone(await self.client.zone_name()),
+        )
 
-            # Check for quest/goal changes after UI handling
-            if await self._check_quest_goal_changes(f"travel_after_ui_attempt_{failed_attempts + 1}"):
-                logger.warning("[TRAVEL] Quest/goal changes detected after UI handling, exiting travel")
-                break
-            
-            # Check if UI interaction caused a zone change
-            current_zone_after_ui = await self.client.zone_name()
-            if current_zone_after_ui != zone_before_action:
-                logger.success("UI interaction resulted in a zone change. Re-evaluating position.")
-                # Reset radius offset after successful zone change
-                player_radius_offset = 1
-                # Update world tracking since we changed zones
-                initial_world = Utils.get_world_from_zone(current_zone_after_ui)
-                continue
-
-            # If no UI was available or handled (or we skipped UI due to world switch), attempt WorldsCollideTP
-            if not ui_handled:
-                logger.warning("No interactive zoning UI available. Using WorldsCollideTP to move closer...")
-                try:
-                    await WorldsCollideTP(self.client, player_radius_offset=player_radius_offset)
-                    await asyncio.sleep(2.0)
-                    
-                    # Check for quest/goal changes after teleportation
-                    if await self._check_quest_goal_changes(f"travel_after_teleport_attempt_{failed_attempts + 1}"):
-                        logger.warning("[TRAVEL] Quest/goal changes detected after teleportation, exiting travel")
-                        break
-                    
-                    # IMMEDIATELY check for dialogue and UI that might appear after teleportation
-                    await self._handle_dialogue()
-                    
-                    # Check for quest/goal changes after post-teleport dialogue
-                    if await self._check_quest_goal_changes(f"travel_after_post_teleport_dialogue_attempt_{failed_attempts + 1}"):
-                        logger.warning("[TRAVEL] Quest/goal changes detected after post-teleport dialogue, exiting travel")
-                        break
-                    
-                    # Check if dialogue handling caused a zone change
-                    zone_after_dialogue = await self.client.zone_name()
-                    if zone_after_dialogue != zone_before_action:
-                        logger.success("Post-teleportation dialogue handling resulted in zone change.")
-                        player_radius_offset = 1
-                        # Update world tracking since we changed zones
-                        initial_world = Utils.get_world_from_zone(zone_after_dialogue)
-                        continue
-                    
-                    # Also check for other UI elements that might have appeared
-                    ui_appeared = await self._handle_spiral_door(destination_zone)
-                    if not ui_appeared:
-                        ui_appeared = await self._handle_sigil_entry()
-                    
-                    if ui_appeared:
-                        logger.info("UI elements appeared after teleportation, will re-evaluate in next loop.")
-                        # Update world tracking in case UI caused world change
-                        post_ui_zone = await self.client.zone_name()
-                        initial_world = Utils.get_world_from_zone(post_ui_zone)
-                        continue
-                    
-                except Exception as e:
-                    logger.error(f"An error occurred during WorldsCollideTP: {e}", exc_info=True)
-                    failed_attempts += 1
-                    # Increase radius offset to push away from collision issues
-                    player_radius_offset = min(player_radius_offset + 0.2, 1.5)
-                    continue
-
-                # Check if WorldsCollideTP made progress (zone change or significant position change)
-                zone_after_tp = await self.client.zone_name()
-                position_after_tp = await self.client.body.position()
-                
-                # Calculate distance moved
-                distance_moved = ((position_after_tp.x - position_before_action.x) ** 2 + 
-                                (position_after_tp.y - position_before_action.y) ** 2) ** 0.5
-                
-                zone_changed = zone_after_tp != zone_before_action
-                significant_movement = distance_moved > 200  # Minimum progress threshold
-                
-                if zone_changed or significant_movement:
-                    if zone_changed:
-                        logger.success(f"Zone change detected: {zone_before_action} → {zone_after_tp}")
-                    else:
-                        logger.success(f"Significant movement detected: {distance_moved:.1f} units")
-                    
-                    # Reset radius offset after successful movement
-                    player_radius_offset = 1
-                    # Update world tracking in case we moved to a new world
-                    initial_world = Utils.get_world_from_zone(zone_after_tp)
-                    # Update position tracking for next iteration
-                    position_before_action = position_after_tp
-                else:
-                    logger.error(f"No progress made in this travel attempt (moved {distance_moved:.1f} units, zone unchanged).")
-                    failed_attempts += 1
-                    # Increase radius offset to avoid getting stuck in same location
-                    player_radius_offset = min(player_radius_offset + 0.2, 1.5)
-        else:
+        deadline = asyncio.get_running_loop().time() + timeout
+        reached = await self._travel_until_arrived(state, deadline)
+        if not reached and asyncio.get_running_loop().time() >= deadline:
+            logger.error(f"Failed to reach destination zone '{destination_zone}' within {timeout:.0f} seconds.")
+            return
+        if not reached:
             logger.error(
-                f"Failed to reach destination zone '{destination_zone}' after {max_failed_attempts} failed attempts.")
+                f"Failed to reach destination zone '{destination_zone}' after {state.max_failed_attempts} failed attempts.")
             return
 
         logger.info("Performing final teleport to precise waypoint location...")
         try:
-            await WorldsCollideTP(self.client, player_radius_offset=player_radius_offset)
+            await WorldsCollideTP(self.client, player_radius_offset=state.player_radius_offset,
+                                  geometry_cache=state.geometry_cache)
             await asyncio.sleep(1.0)
             # Final UI check after arriving at the exact spot
             await self._handle_dialogue()
@@ -808,6 +1001,179 @@ class BestQuest:
         except Exception as e:
             logger.error(f"Final teleportation failed: {e}", exc_info=True)
 
+    async def _travel_until_arrived(self, state: TravelState, deadline: float) -> bool:
+        """Runs travel steps until arrival or a quest change. Returns False if attempts or time ran out."""
+        loop = asyncio.get_running_loop()
+        # Checked between steps so a teleport or zone change is never cut off halfway
+        while state.failed_attempts < state.max_failed_attempts and loop.time() < deadline:
+            step = await self._one_travel_step(state)
+            if step in (TravelStep.ARRIVED, TravelStep.ABORTED):
+                return True
+            if step == TravelStep.FAILED:
+                state.record_failure()
+        return False
+
+    async def _one_travel_step(self, state: TravelState) -> TravelStep:
+        attempt = state.failed_attempts + 1
+        destination_zone = state.destination_zone
+
+        # Check for quest/goal changes at the start of each travel loop
+        if await self._check_quest_goal_changes(f"travel_loop_start_attempt_{attempt}"):
+            logger.warning("[TRAVEL] Quest/goal changes detected in travel loop, exiting travel")
+            return TravelStep.ABORTED
+
+        current_zone = await self.client.zone_name()
+        if not current_zone:
+            await asyncio.sleep(0.5)
+            return TravelStep.RETRY
+
+        logger.info(
+            f"Travel Loop | Attempt [{attempt}/{state.max_failed_attempts}] | Destination: '{destination_zone}' | Current: '{current_zone}' | Radius Offset: {state.player_radius_offset}")
+
+        # Check if we've reached the destination zone
+        if current_zone == destination_zone:
+            logger.success("Player is in the correct zone.")
+            return TravelStep.ARRIVED
+
+        # Check if goal has changed (quest progression) by re-checking active quest
+        if state.initial_goal_id:
+            # Also check if the current goal is still active by re-matching on-screen text.
+            # In-zone goal progress (dialogue etc.) is already caught by the change check at the top
+            # of the step, so the re-match only needs to run after a zone change.
+            current_on_screen_text = ""
+            if current_zone != state.last_matched_zone:
+                # Shares the quest table read with the change check at the top of the step
+                (current_quest_id, current_active_quest, current_goals), current_on_screen_text = await asyncio.gather(
+                    self._active_quest_snapshot(), Utils.get_on_screen_goal_text(self.client))
+            else:
+                current_quest_id, current_active_quest, current_goals = await self._active_quest_snapshot()
+            if current_quest_id != state.active_quest_id:
+                logger.info("Active quest has changed during travel, exiting travel loop.")
+                return TravelStep.ABORTED
+
+            if current_on_screen_text and current_active_quest:
+                current_identified_goal_id, current_identified_goal = await self._find_goal_by_text_matching(current_on_screen_text, current_goals)
+                # Only settle the zone once text actually matched; the goal tracker can still be empty right after zoning
+                if current_identified_goal_id:
+                    state.last_matched_zone = current_zone
+                if current_identified_goal_id and current_identified_goal_id != state.initial_goal_id:
+                    logger.info(f"Goal has changed from {state.initial_goal_id} to {current_identified_goal_id}, exiting travel loop.")
+                    return TravelStep.ABORTED
+
+        zone_before_action = current_zone
+        position_before_action = await self.client.body.position()
+
+        # Check if we just switched worlds in this loop iteration
+        just_switched_worlds = state.switch_world(current_zone)
+        if just_switched_worlds:
+            logger.info(f"Detected world switch to '{state.initial_world}'. Skipping initial UI handling to avoid reopening spiral door.")
+
+        # FIRST: Check player state and handle any blocking conditions
+        if not just_switched_worlds:
+            # Wait for player to be in a free state before proceeding
+            await self._wait_for_free_state(timeout=10.0)
+
+            # Check and handle current player state
+            state_handled = await self._check_and_handle_player_state()
+
+            # Either wait can sit out a loading screen, so the zone read at the top of the step may be stale
+            current_zone = await self.client.zone_name()
+            if current_zone != zone_before_action:
+                logger.success("Zone changed while waiting for a free state. Re-evaluating position.")
+                state.reached_zone(current_zone)
+                return TravelStep.RETRY
+
+            # Handle UI elements off a single snapshot of every probe
+            ui = await self._ui_snapshot()
+            dialogue_ran = ui.popup or ui.dialogue_advance or ui.npc_range
+            dialogue_handled = dialogue_ran and await self._handle_dialogue(ui)
+            # Dialogue handling may press X (at a World Gate that is what opens the spiral door), so re-probe after it
+            ui_handled = dialogue_handled or await self._handle_zoning_ui(
+                destination_zone, current_zone, None if dialogue_ran else ui)
+
+            # Check again for dialogue after UI interactions if no sigil was handled
+            if not dialogue_handled:
+                await self._handle_dialogue()
+        else:
+            # If we just switched worlds, we still need to track ui_handled for logic flow
+            ui_handled = False
+            logger.info("Skipped UI handling due to recent world switch. Proceeding directly to teleportation.")
+
+        # Check for quest/goal changes after UI handling
+        if await self._check_quest_goal_changes(f"travel_after_ui_attempt_{attempt}"):
+            logger.warning("[TRAVEL] Quest/goal changes detected after UI handling, exiting travel")
+            return TravelStep.ABORTED
+
+        # Check if UI interaction caused a zone change
+        current_zone_after_ui = await self.client.zone_name()
+        if current_zone_after_ui != zone_before_action:
+            logger.success("UI interaction resulted in a zone change. Re-evaluating position.")
+            state.reached_zone(current_zone_after_ui)
+            return TravelStep.RETRY
+
+        # UI was handled without changing zone, re-evaluate on the next step
+        if ui_handled:
+            return TravelStep.RETRY
+
+        # If no UI was available or handled (or we skipped UI due to world switch), attempt WorldsCollideTP
+        logger.warning("No interactive zoning UI available. Using WorldsCollideTP to move closer...")
+        try:
+            await WorldsCollideTP(self.client, player_radius_offset=state.player_radius_offset,
+                                  geometry_cache=state.geometry_cache)
+            await asyncio.sleep(2.0)
+
+            # Check for quest/goal changes after teleportation
+            if await self._check_quest_goal_changes(f"travel_after_teleport_attempt_{attempt}"):
+                logger.warning("[TRAVEL] Quest/goal changes detected after teleportation, exiting travel")
+                return TravelStep.ABORTED
+
+            # IMMEDIATELY check for dialogue and UI that might appear after teleportation
+            await self._handle_dialogue()
+
+            # Check for quest/goal changes after post-teleport dialogue
+            if await self._check_quest_goal_changes(f"travel_after_post_teleport_dialogue_attempt_{attempt}"):
+                logger.warning("[TRAVEL] Quest/goal changes detected after post-teleport dialogue, exiting travel")
+                return TravelStep.ABORTED
+
+            # Check if dialogue handling caused a zone change
+            zone_after_dialogue = await self.client.zone_name()
+            if zone_after_dialogue != zone_before_action:
+                logger.success("Post-teleportation dialogue handling resulted in zone change.")
+                state.reached_zone(zone_after_dialogue)
+                return TravelStep.RETRY
+
+            # Also check for other UI elements that might have appeared
+            ui_appeared = await self._handle_zoning_ui(destination_zone, zone_after_dialogue)
+
+            if ui_appeared:
+                logger.info("UI elements appeared after teleportation, will re-evaluate in next loop.")
+                # Update world tracking in case UI caused world change
+                state.switch_world(await self.client.zone_name())
+                return TravelStep.RETRY
+
+        except Exception as e:
+            logger.error(f"An error occurred during WorldsCollideTP: {e}", exc_info=True)
+            return TravelStep.FAILED
+
+        # Check if WorldsCollideTP made progress (zone change or significant position change)
+        # No UI acted since zone_after_dialogue was read, so the zone is unchanged since then
+        zone_after_tp = zone_after_dialogue
+        position_after_tp = await self.client.body.position()
+
+        # Calculate distance moved; the decision works on the square, the root is only taken for the log line
+        dx = position_after_tp.x - position_before_action.x
+        dy = position_after_tp.y - position_before_action.y
+        distance_moved_sq = dx * dx + dy * dy
+
+        step = state.judge_teleport(zone_before_action, zone_after_tp, distance_moved_sq)
+        if step == TravelStep.FAILED:
+            logger.error(f"No progress made in this travel attempt (moved {distance_moved_sq ** 0.5:.1f} units, zone unchanged).")
+        elif zone_after_tp != zone_before_action:
+            logger.success(f"Zone change detected: {zone_before_action} → {zone_after_tp}")
+        else:
+            logger.success(f"Significant movement detected: {distance_moved_sq ** 0.5:.1f} units")
+        return step
+
     # </editor-fold>
 
     # <editor-fold desc="Goal Handlers">
@@ -884,66 +1250,27 @@ class BestQuest:
         except Exception as e:
             logger.error(f"[HANDLER] Error in usage goal handler: {e}", exc_info=True)
 
-    async def _handle_bounty_goal(self, goal: GoalData):
-        logger.info("Handling BOUNTY goal.")
-        await self._travel_to_goal_location(goal)
-        logger.info("This is a Defeat quest. Waiting for player to enter combat...")
-        await self._wait_for_combat_start()
-
-    async def _handle_bountycollect_goal(self, goal: GoalData):
-        logger.info("Handling BOUNTYCOLLECT goal.")
+    async def _handle_defeat_goal(self, goal: GoalData):
+        goal_type = await self._goal_type(goal)
+        logger.info(f"Handling {goal_type.name.upper()} goal.")
         await self._travel_to_goal_location(goal)
-        logger.info("This is a Defeat and Collect quest. Waiting for player to enter combat...")
+        logger.info(f"This is a {_DEFEAT_GOAL_KINDS[goal_type]} quest. Waiting for player to enter combat...")
         await self._wait_for_combat_start()
 
-    async def _handle_scavenge_goal(self, goal: GoalData):
-        logger.info("Handling SCAVENGE goal.")
-        await self._travel_to_goal_location(goal)
-
-    async def _handle_scavengefake_goal(self, goal: GoalData):
-        logger.info("Handling SCAVENGEFAKE goal.")
-        await self._travel_to_goal_location(goal)
-
-    async def _handle_achieverank_goal(self, goal: GoalData):
-        logger.info("Handling ACHIEVERANK goal.")
-        await self._travel_to_goal_location(goal)
-
-    async def _handle_completequest_goal(self, goal: GoalData):
-        logger.info("Handling COMPLETEQUEST goal.")
-        await self._travel_to_goal_location(goal)
-
-    async def _handle_sociarank_goal(self, goal: GoalData):
-        logger.info("Handling SOCIARANK goal.")
-        await self._travel_to_goal_location(goal)
-
-    async def _handle_sociacurrency_goal(self, goal: GoalData):
-        logger.info("Handling SOCIACURRENCY goal.")
-        await self._travel_to_goal_location(goal)
-
-    async def _handle_sociaminigame_goal(self, goal: GoalData):
-        logger.info("Handling SOCIAMINIGAME goal.")
-        await self._travel_to_goal_location(goal)
-
-    async def _handle_sociagiveitem_goal(self, goal: GoalData):
-        logger.info("Handling SOCIAGIVEITEM goal.")
-        await self._travel_to_goal_location(goal)
-
-    async def _handle_sociagetitem_goal(self, goal: GoalData):
-        logger.info("Handling SOCIAGETITEM goal.")
-        await self._travel_to_goal_location(goal)
-
-    async def _handle_collectafterbounty_goal(self, goal: GoalData):
-        logger.info("Handling COLLECTAFTERBOUNTY goal.")
-        await self._travel_to_goal_location(goal)
-
-    async def _handle_encounter_waypoint_foreach_goal(self, goal: GoalData):
-        logger.info("Handling ENCOUNTER_WAYPOINT_FOREACH goal.")
-        await self._travel_to_goal_location(goal)
-
     async def _handle_unimplemented_goal(self, goal: GoalData):
         goal_type = await goal.goal_type()
         logger.warning(f"No handler implemented for GoalType '{goal_type.name}'. Skipping.")
 
+    async def _goal_type(self, goal: GoalData) -> GoalType:
+        goal_type = self._goal_type_cache.get(goal.base_address)
+        if goal_type is None:
+            goal_type = self._goal_type_cache[goal.base_address] = await goal.goal_type()
+        return goal_type
+
+    def _get_goal_handler(self, goal_type: GoalType):
+        handler_name = _GOAL_HANDLER_NAMES[goal_type.value] if goal_type.value < len(_GOAL_HANDLER_NAMES) else None
+        return getattr(self, handler_name or '_handle_unimplemented_goal')
+
     # </editor-fold>
 
     # <editor-fold desc="Goal Matching Logic">
@@ -952,42 +1279,87 @@ class BestQuest:
         if not on_screen_text:
             return None, None
 
+        # Goal ids are unique across quests, so identical text over the same goal set gives the same match
+        match_key = (on_screen_text, frozenset(goals))
+        matched_id = self._goal_matches.get(match_key)
+        if matched_id is not None:
+            # Goals can share on-screen text, so a remembered goal only wins while it is still incomplete
+            if not await goals[matched_id].goal_status():
+                return matched_id, goals[matched_id]
+            del self._goal_matches[match_key]
+
+        # Completed goals can never be the on-screen goal, so drop them before the madlib reads
+        statuses = await asyncio.gather(*(goal.goal_status() for goal in goals.values()))
+        candidates = [(goal_id, goal) for (goal_id, goal), status in zip(goals.items(), statuses) if not status]
+
+        # Bound how many goals are read at once so a long quest does not flood the client with reads
+        read_slots = asyncio.Semaphore(8)
+
+        async def read_raw_madlib_values(goal: GoalData) -> List[str]:
+            async with read_slots:
+                madlib_block = await goal.madlib_block()
+                if not madlib_block:
+                    return []
+                entries = await madlib_block.entries()
+                raw_values = await asyncio.gather(*(entry.maybe_data_str() for entry in entries))
+            return [value for value in raw_values if value]
+
+        keys = [(goal_id, goal.base_address) for goal_id, goal in candidates]
+        missing = [(key, goal) for key, (_, goal) in zip(keys, candidates) if key not in self._madlib_cache]
+        if missing:
+            raw_value_lists = await asyncio.gather(*(read_raw_madlib_values(goal) for _, goal in missing))
+            # Zone and NPC keys recur across goals, so translate each distinct key once
+            unique_keys = list(dict.fromkeys(value for raw_values in raw_value_lists for value in raw_values))
+            translations = dict(zip(unique_keys, await asyncio.gather(
+                *(Utils.translate_lang_key(self.client, value) for value in unique_keys))))
+            for (key, _), raw_values in zip(missing, raw_value_lists):
+                # Some values are "a|b" alternatives; the on-screen text uses the last one
+                self._madlib_cache[key] = [translations[value].rsplit('|', 1)[-1] for value in raw_values]
+        candidates = [(goal_id, goal, self._madlib_cache[key])
+                      for key, (goal_id, goal) in zip(keys, candidates) if self._madlib_cache[key]]
+        # Goals with more values can score higher, so try them first and stop once nobody left can win
+        candidates.sort(key=lambda candidate: len(candidate[2]), reverse=True)
+
+        all_madlib_values = [madlib_values for _, _, madlib_values in candidates]
+        on_screen_values = _find_on_screen_values(on_screen_text, all_madlib_values)
+
         best_match_goal = None
         best_match_id = None
         highest_score = 0
 
-        for goal_id, goal in goals.items():
-            if await goal.goal_status():
-                continue
-
-            madlib_block = await goal.madlib_block()
-            if not madlib_block:
-                continue
-
-            current_score = 0
-            madlib_values = []
-            entries = await madlib_block.entries()
-            for entry in entries:
-                value = await entry.maybe_data_str()
-                if value:
-                    translated = await Utils.translate_lang_key(self.client, value)
-                    if '|' in translated:
-                        madlib_values.append(translated.split('|')[-1])
-                    else:
-                        madlib_values.append(translated)
-
-            for value in madlib_values:
-                if value and value in on_screen_text:
-                    current_score += 1
+        for goal_id, goal, madlib_values in candidates:
+            if highest_score >= 2 and len(madlib_values) <= highest_score:
+                break
+            if on_screen_values is not None:
+                current_score = sum(1 for value in madlib_values if value in on_screen_values)
+            else:
+                current_score = _score_madlib_values(on_screen_text, tuple(madlib_values))
 
-            logger.debug(f"Goal at {hex(goal.base_address)} has values {madlib_values} and scored {current_score}")
+            # Lazy so the hex/list formatting is skipped entirely unless DEBUG is enabled
+            logger.opt(lazy=True).debug("Goal at {} has values {} and scored {}",
+                                        lambda: hex(goal.base_address), lambda: madlib_values, lambda: current_score)
 
             if current_score > highest_score:
                 highest_score = current_score
                 best_match_goal = goal
                 best_match_id = goal_id
 
+        # Fuzzy matches are guesses, so only exact matches are remembered for the rest of the quest
+        exact_match = highest_score >= 2
+        if not exact_match:
+            # Nothing matched exactly; tolerate small misreads of the goal text before giving up
+            for goal_id, goal, madlib_values in candidates:
+                current_score = _fuzzy_score_madlib_values(on_screen_text, tuple(madlib_values))
+                if current_score > highest_score:
+                    highest_score = current_score
+                    best_match_goal = goal
+                    best_match_id = goal_id
+            if highest_score >= 2:
+                logger.debug(f"Goal at {hex(best_match_goal.base_address)} matched by fuzzy fallback")
+
         if highest_score >= 2:
+            if exact_match:
+                self._goal_matches[match_key] = best_match_id
             return best_match_id, best_match_goal
 
         return None, None
@@ -1001,6 +1373,9 @@ class BestQuest:
     # <editor-fold desc="Object Inspection Utilities">
     async def _inspect_object_completely(self, obj, obj_name: str, indent: int = 0):
         """Comprehensively inspect any object and log ALL available data"""
+        # Calls every coroutine on the object, so it stays off unless research output was asked for
+        if not self.debug_inspect:
+            return
         indent_str = ' ' * indent
         logger.warning(f"{indent_str}[OBJECT_INSPECTION] ===== {obj_name} COMPLETE INSPECTION =====")
         
@@ -1018,26 +1393,12 @@ class BestQuest:
             mro = getattr(obj.__class__, '__mro__', [])
             logger.warning(f"{indent_str}[OBJECT_INSPECTION] Class Hierarchy: {[cls.__name__ for cls in mro]}")
             
-            # Get all attributes and methods
-            all_attrs = dir(obj)
-            logger.warning(f"{indent_str}[OBJECT_INSPECTION] Total Attributes/Methods: {len(all_attrs)}")
-            
-            # Separate methods from properties
-            methods = []
-            properties = []
-            
-            for attr_name in all_attrs:
-                if attr_name.startswith('_'):
-                    continue  # Skip private/protected
-                
-                try:
-                    attr = getattr(obj, attr_name)
-                    if callable(attr):
-                        methods.append(attr_name)
-                    else:
-                        properties.append(attr_name)
-                except Exception:
-                    logger.warning(f"{indent_str}[OBJECT_INSPECTION] Could not access attribute: {attr_name}")
+            # Separate methods from properties off the class, without firing a descriptor per name
+            methods, properties = _class_layout(type(obj))
+            instance_attrs = [name for name in getattr(obj, '__dict__', ())
+                              if not name.startswith('_') and name not in methods and name not in properties]
+            properties = properties + tuple(instance_attrs)
+            logger.warning(f"{indent_str}[OBJECT_INSPECTION] Total Attributes/Methods: {len(methods) + len(properties)}")
             
             # Log properties first
             logger.warning(f"{indent_str}[OBJECT_INSPECTION] --- PROPERTIES ({len(properties)}) ---")
@@ -1086,6 +1447,20 @@ class BestQuest:
     # </editor-fold>
 
     # <editor-fold desc="Quest/Goal Change Detection">
+    async def _active_quest_snapshot(self) -> Tuple[int, QuestData | None, Dict[int, GoalData]]:
+        """(active quest id, active quest, its goals).
+        Handlers asking within the same coalescing window share one read of the quest tables."""
+        return await Utils.coalesced_read(self.client, 'active_quest', self._read_active_quest)
+
+    async def _read_active_quest(self) -> Tuple[int, QuestData | None, Dict[int, GoalData]]:
+        quest_manager, character_registry = await asyncio.gather(
+            self.client.quest_manager(), self.client.character_registry())
+        active_quest_id, all_quests = await asyncio.gather(
+            character_registry.active_quest_id(), quest_manager.quest_data())
+        active_quest = all_quests.get(active_quest_id) if active_quest_id else None
+        all_goals = await active_quest.goal_data() if active_quest else {}
+        return active_quest_id, active_quest, all_goals
+
     async def _check_quest_goal_changes(self, context: str = "") -> bool:
         """
         Check if the current quest ID, goal ID, or goal type has changed.
@@ -1094,11 +1469,9 @@ class BestQuest:
         try:
             logger.debug(f"[CHANGE_DETECTION] Checking quest/goal changes - Context: {context}")
             
-            # Get current quest manager state
-            quest_manager = await self.client.quest_manager()
-            character_registry = await self.client.character_registry()
-            
-            current_quest_id = await character_registry.active_quest_id()
+            # Get current quest manager state; the goal text is a separate window read, so fetch it alongside
+            (current_quest_id, active_quest, all_goals), on_screen_text = await asyncio.gather(
+                self._active_quest_snapshot(), Utils.get_on_screen_goal_text(self.client))
             
             if not current_quest_id:
                 logger.warning(f"[CHANGE_DETECTION] No active quest ID found - Context: {context}")
@@ -1110,20 +1483,21 @@ class BestQuest:
                     return True
                 return False
             
+            if current_quest_id != self.current_quest_id:
+                # The old quest's goals are gone and their addresses may be reused, so drop per-goal caches first
+                self._madlib_cache.clear()
+                self._goal_type_cache.clear()
+                self._goal_matches.clear()
+
             # Get current goal information
-            all_quests = await quest_manager.quest_data()
-            active_quest = all_quests.get(current_quest_id)
-            
             current_goal_id = None
             current_goal_type = None
             
             if active_quest:
-                on_screen_text = await Utils.get_on_screen_goal_text(self.client)
-                all_goals = await active_quest.goal_data()
                 current_goal_id, current_goal = await self._find_goal_by_text_matching(on_screen_text, all_goals)
                 
                 if current_goal:
-                    current_goal_type = await current_goal.goal_type()
+                    current_goal_type = await self._goal_type(current_goal)
             
             # Check for changes
             quest_id_changed = self.current_quest_id != current_quest_id
@@ -1180,11 +1554,12 @@ class BestQuest:
                 logger.warning(f"[RE_EVALUATION] New Quest: {quest_name} (ID: {quest_id})")
                 
                 # Complete QuestData inspection
-                await self._inspect_object_completely(active_quest, f"QuestData_{quest_id}", 2)
+                if self.debug_inspect:
+                    await self._inspect_object_completely(active_quest, f"QuestData_{quest_id}", 2)
                 
                 if goal:
                     goal_name = await Utils.translate_lang_key(self.client, await goal.name_lang_key())
-                    goal_type = await goal.goal_type()
+                    goal_type = await self._goal_type(goal)
                     goal_destination = await goal.goal_destination_zone()
                     goal_status = await goal.goal_status()
                     
@@ -1194,12 +1569,13 @@ class BestQuest:
                     logger.warning(f"[RE_EVALUATION] Goal Status: {'Complete' if goal_status else 'Incomplete'}")
                     
                     # Log handler that would be used
-                    handler_method = self.goal_handlers.get(goal_type, self._handle_unimplemented_goal)
+                    handler_method = self._get_goal_handler(goal_type)
                     handler_name = handler_method.__name__ if handler_method else "unknown"
                     logger.warning(f"[RE_EVALUATION] Handler Method: {handler_name}")
                     
                     # Complete GoalData inspection
-                    await self._inspect_object_completely(goal, f"GoalData_{goal_id}", 2)
+                    if self.debug_inspect:
+                        await self._inspect_object_completely(goal, f"GoalData_{goal_id}", 2)
                     
                     # Deep madlib inspection
                     madlib_block = await goal.madlib_block()
@@ -1207,24 +1583,25 @@ class BestQuest:
                         logger.warning("[RE_EVALUATION] Madlib Basic Entries:")
                         entries = await madlib_block.entries()
                         for i, entry in enumerate(entries):
-                            identifier = await entry.identifier()
-                            data_str = await entry.maybe_data_str()
+                            identifier, data_str = await asyncio.gather(entry.identifier(), entry.maybe_data_str())
                             # identifier is a field name (like "NAME", "LOCATION"), not a lang key - don't translate it
                             # data_str is the actual lang key that should be translated
                             translated_data = await Utils.translate_lang_key(self.client, data_str) if data_str else "None"
                             logger.warning(f"[RE_EVALUATION]   - {identifier}: {translated_data}")
                         
                         # Complete MadlibBlock inspection
-                        await self._inspect_object_completely(madlib_block, f"MadlibBlock_{goal_id}", 2)
-                        
-                        # Inspect each MadlibEntry
-                        for i, entry in enumerate(entries):
-                            await self._inspect_object_completely(entry, f"MadlibEntry_{i}_{goal_id}", 4)
+                        if self.debug_inspect:
+                            await self._inspect_object_completely(madlib_block, f"MadlibBlock_{goal_id}", 2)
+                            
+                            # Inspect each MadlibEntry
+                            for i, entry in enumerate(entries):
+                                await self._inspect_object_completely(entry, f"MadlibEntry_{i}_{goal_id}", 4)
                     
                     # Inspect ClientTagList if available
-                    client_tags = await goal.client_tag_list()
-                    if client_tags:
-                        await self._inspect_object_completely(client_tags, f"ClientTagList_{goal_id}", 2)
+                    if self.debug_inspect:
+                        client_tags = await goal.client_tag_list()
+                        if client_tags:
+                            await self._inspect_object_completely(client_tags, f"ClientTagList_{goal_id}", 2)
                 
             logger.warning("[RE_EVALUATION] =====================================")
         except Exception as e:
@@ -1259,32 +1636,31 @@ class BestQuest:
             logger.warning("[RUN] Quest/goal changes detected after state handling, restarting run cycle")
             return
         
+        # The on-screen goal text is a window walk independent of the quest tables, so overlap it with them
+        on_screen_text_task = asyncio.create_task(Utils.get_on_screen_goal_text(self.client))
         try:
-            quest_manager = await self.client.quest_manager()
-            character_registry = await self.client.character_registry()
-
-            active_quest_id = await character_registry.active_quest_id()
+            # Usually still shared with the change check that just ran
+            active_quest_id, active_quest, all_goals = await self._active_quest_snapshot()
             if not active_quest_id:
                 logger.warning("No active quest is being tracked. Cannot proceed.")
                 return
 
-            all_quests = await quest_manager.quest_data()
-            active_quest = all_quests.get(active_quest_id)
-
             if not active_quest:
                 logger.error(f"Tracked quest ID {active_quest_id} not found in quest log.")
                 return
 
-            on_screen_text = await Utils.get_on_screen_goal_text(self.client)
-            all_goals = await active_quest.goal_data()
+            on_screen_text = await on_screen_text_task
             identified_goal_id, identified_goal = await self._find_goal_by_text_matching(on_screen_text, all_goals)
+            destination_zone = await identified_goal.goal_destination_zone() if identified_goal else ""
         except Exception as e:
             logger.error(f"[RUN] Error getting quest manager data: {e}", exc_info=True)
             return
+        finally:
+            # No-op once awaited; drops the read on the early-return paths
+            on_screen_text_task.cancel()
 
         # Initial check for blocking UI before starting the main logic
         zone_before_action = await self.client.zone_name()
-        position_before_action = await self.client.body.position()
         
         # Wait for player to be free before starting quest logic
         await self._wait_for_free_state(timeout=15.0)
@@ -1297,80 +1673,95 @@ class BestQuest:
             logger.warning("[RUN] Quest/goal changes detected after initial setup, restarting run cycle")
             return
         
-        if identified_goal:
-            ui_handled = await self._handle_spiral_door(await identified_goal.goal_destination_zone())
-            if not ui_handled:
-                ui_handled = await self._handle_sigil_entry()
-            # Always check for dialogue after any teleportation or UI interaction
-            await self._handle_dialogue()
-            
-            # Check for changes after UI handling
-            if await self._check_quest_goal_changes("after_ui_handling"):
-                logger.warning("[RUN] Quest/goal changes detected after UI handling, restarting run cycle")
-                return
-            
-            if await self.client.zone_name() != zone_before_action:
-                logger.info("UI handled at start of loop, restarting run.")
-                return
-        else:
+        if not identified_goal:
             # Still handle dialogue even if no goal identified
             await self._handle_dialogue()
-
-        if not identified_goal:
             logger.error("Could not identify an active goal from on-screen text.")
             return
 
+        ui_handled = await self._handle_zoning_ui(destination_zone)
+        # Always check for dialogue after any teleportation or UI interaction
+        await self._handle_dialogue()
+        
+        # Check for changes after UI handling
+        if await self._check_quest_goal_changes("after_ui_handling"):
+            logger.warning("[RUN] Quest/goal changes detected after UI handling, restarting run cycle")
+            return
+        
+        if await self.client.zone_name() != zone_before_action:
+            logger.info("UI handled at start of loop, restarting run.")
+            return
+
         logger.info(
             f"Currently tracking quest: '{await Utils.translate_lang_key(self.client, await active_quest.name_lang_key())}'")
 
-        await self.log_full_quest_to_db(active_quest, active_quest_id)
-
+        # The DB write is independent of goal handling, so it runs alongside dispatch instead of ahead of it
+        db_log_task = asyncio.create_task(self.log_full_quest_to_db(active_quest, active_quest_id))
+        # The printed report reads the quest before the handler moves it on, so it stays ahead of dispatch
         await self._print_quest_details(active_quest, active_quest_id, self.client)
+        try:
+            logger.info(f"Attempting to match on-screen text: '{on_screen_text}'")
+            logger.success(f"Successfully matched text to Goal ID: {identified_goal_id} (Full 64-bit)")
 
-        logger.info(f"Attempting to match on-screen text: '{on_screen_text}'")
-        logger.success(f"Successfully matched text to Goal ID: {identified_goal_id} (Full 64-bit)")
-
-        active_goal = identified_goal
-        goal_type = await active_goal.goal_type()
+            active_goal = identified_goal
+            goal_type = await self._goal_type(active_goal)
 
-        handler_method = self.goal_handlers.get(goal_type, self._handle_unimplemented_goal)
+            handler_method = self._get_goal_handler(goal_type)
 
-        logger.info(f"Processing active goal of type '{goal_type.name}'...")
-        # input("Quest Auditor -> Press Enter to after looking at the type of goal.")
+            logger.info(f"Processing active goal of type '{goal_type.name}' with {handler_method.__name__}...")
+            if self.debug_pause:
+                # input() blocks, so run it off the loop to keep key hooks and pending reads alive
+                await asyncio.to_thread(input, "Quest Auditor -> Press Enter to after looking at the type of goal.")
 
-        # Check for changes before executing handler
-        if await self._check_quest_goal_changes("before_handler_execution"):
-            logger.warning("[RUN] Quest/goal changes detected before handler execution, restarting run cycle")
-            return
+            # Check for changes before executing handler
+            if await self._check_quest_goal_changes("before_handler_execution"):
+                logger.warning("[RUN] Quest/goal changes detected before handler execution, restarting run cycle")
+                return
 
-        await handler_method(active_goal)
+            await handler_method(active_goal)
 
-        # Check for changes after handler execution
-        if await self._check_quest_goal_changes("after_handler_execution"):
-            logger.warning("[RUN] Quest/goal changes detected after handler execution, restarting run cycle")
-            return
+            # Check for changes after handler execution
+            if await self._check_quest_goal_changes("after_handler_execution"):
+                logger.warning("[RUN] Quest/goal changes detected after handler execution, restarting run cycle")
+                return
 
-        # Final check after a handler has run
-        if identified_goal:
-            ui_handled = await self._handle_spiral_door(await identified_goal.goal_destination_zone())
-            if not ui_handled:
-                ui_handled = await self._handle_sigil_entry()
+            # Final check after a handler has run
+            ui_handled = await self._handle_zoning_ui(destination_zone)
         
-        # Check for changes after final UI handling
-        if await self._check_quest_goal_changes("after_final_ui"):
-            logger.warning("[RUN] Quest/goal changes detected after final UI handling, restarting run cycle")
-            return
+            # Check for changes after final UI handling
+            if await self._check_quest_goal_changes("after_final_ui"):
+                logger.warning("[RUN] Quest/goal changes detected after final UI handling, restarting run cycle")
+                return
         
-        # Final state check and dialogue handling
-        await self._check_and_handle_player_state()
-        await self._handle_dialogue()
+            # Final state check and dialogue handling
+            await self._check_and_handle_player_state()
+            await self._handle_dialogue()
         
-        # Final check for changes
-        await self._check_quest_goal_changes("run_end")
+            # Final check for changes
+            await self._check_quest_goal_changes("run_end")
+        finally:
+            (result,) = await asyncio.gather(db_log_task, return_exceptions=True)
+            if isinstance(result, Exception):
+                logger.error(f"[RUN] Quest DB log failed: {result}")
+
+
+def _watch_console(loop: asyncio.AbstractEventLoop, exit_event: asyncio.Event):
+    """Console stand-in for the global exit hotkey: '1' then Enter exits."""
+    for line in sys.stdin:
+        if line.strip() == '1':
+            break
+    loop.call_soon_threadsafe(exit_event.set)
 
 
 async def main():
     """Main execution function."""
+    # keyboard installs OS-level hooks at import; only pay for that when actually running.
+    # It refuses to load without root on Linux, in which case the console stands in for it.
+    try:
+        import keyboard
+    except ImportError:
+        keyboard = None
+
     logger.info("Best Quest Started")
     handler = ClientHandler()
     db_logger = None
@@ -1382,21 +1773,35 @@ async def main():
         db_logger = QuestDatabase()
         best_quest = BestQuest(client, [], db_logger)
 
-        logger.info("Script running. Press NINE to process the current quest, or END to exit.")
-        while True:
-            # if keyboard.is_pressed('9'):
+        # Key hooks fire on keyboard's listener thread, so hand the event back to the loop
+        loop = asyncio.get_running_loop()
+        exit_event = asyncio.Event()
+        if keyboard:
+            keyboard.on_press_key('1', lambda _: loop.call_soon_threadsafe(exit_event.set))
+            logger.info("Script running. Press 1 to exit.")
+        else:
+            # Daemon thread so a pending stdin read never holds up shutdown
+            threading.Thread(target=_watch_console, args=(loop, exit_event), daemon=True).start()
+            logger.info("Global hotkeys unavailable. Script running, type 1 then Enter to exit.")
+
+        # run() returns early whenever the quest or goal changes and relies on this loop to start it again
+        while not exit_event.is_set():
             await best_quest.run()
             logger.info("Quest processing complete. Restarting quest processing loop...")
-            await asyncio.sleep(2.0)  # Brief pause before reprocessing
-            # if keyboard.is_pressed('end'):
-            #     logger.info("Exit key pressed. Shutting down.")
-            #     break
+            try:
+                # Brief pause before reprocessing; wakes straight away on the exit key
+                await asyncio.wait_for(exit_event.wait(), timeout=2.0)
+            except asyncio.TimeoutError:
+                pass
+        logger.info("Exit key pressed. Shutting down.")
 
     except IndexError:
         logger.error("No Wizard101 client found.")
     except Exception as e:
         logger.error(f"An unexpected error occurred in the main loop: {e}", exc_info=True)
     finally:
+        if keyboard:
+            keyboard.unhook_all()
         if db_logger:
             db_logger.close()
         print("Closing client handler.")
@@ -81,8 +81,6 @@ class QuestDatabase:
 
     async def log_goal(self, client: Client, goal: GoalData, goal_id: int, parent_quest_id: int):
         """Logs a GoalData object and its children (tags, madlibs) to the database."""
-        cursor = self.conn.cursor()
-
         name = await Utils.translate_lang_key(client, await goal.name_lang_key())
         raw_name = await goal.name_lang_key()
         goal_type = (await goal.goal_type()).name
@@ -93,43 +91,41 @@ class QuestDatabase:
         has_results = await goal.has_active_results()
         hide_floaty = await goal.hide_goal_floaty_text()
 
-        cursor.execute(
-            'INSERT OR REPLACE INTO goals (goal_id, quest_id, name, raw_name_key, goal_type, destination_zone, status, no_quest_helper, pet_only_goal, has_active_results, hide_floaty_text) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
-            (str(goal_id), str(parent_quest_id), name, raw_name, goal_type, dest_zone, status, no_helper, pet_only,
-             has_results, hide_floaty))
-
-        # Log associated client tags, now passing the quest_id
+        # Associated client tags and madlibs, now passing the quest_id
+        tag_rows = []
         tag_list = await goal.client_tag_list()
         if tag_list:
-            await self.log_client_tags(tag_list, goal_id, parent_quest_id)
+            tag_rows = await self._client_tag_rows(tag_list, goal_id, parent_quest_id)
 
-        # Log associated madlibs, now passing the quest_id
+        madlib_rows = []
         madlib_block = await goal.madlib_block()
         if madlib_block:
             entries = await madlib_block.entries()
             for entry in entries:
-                await self.log_madlib(client, entry, goal_id, parent_quest_id)
-
-        self.conn.commit()
-
-    async def log_client_tags(self, client_tag_list: ClientTagList, parent_goal_id: int, parent_quest_id: int):
-        """Logs a list of client tags for a given goal, including the parent quest_id."""
-        cursor = self.conn.cursor()
+                madlib_rows.append(await self._madlib_row(client, entry, goal_id, parent_quest_id))
+
+        # Every read is done before writing, so the rows go out in one transaction with no awaits inside it
+        with self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO goals (goal_id, quest_id, name, raw_name_key, goal_type, destination_zone, status, no_quest_helper, pet_only_goal, has_active_results, hide_floaty_text) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (str(goal_id), str(parent_quest_id), name, raw_name, goal_type, dest_zone, status, no_helper, pet_only,
+                 has_results, hide_floaty))
+            self.conn.executemany('INSERT INTO goal_client_tags (quest_id, goal_id, tag) VALUES (?, ?, ?)', tag_rows)
+            self.conn.executemany('INSERT INTO madlibs (quest_id, goal_id, identifier, final_value) VALUES (?, ?, ?, ?)',
+                                  madlib_rows)
+
+    async def _client_tag_rows(self, client_tag_list: ClientTagList, parent_goal_id: int, parent_quest_id: int) -> list:
+        """Reads a goal's client tags as goal_client_tags rows, including the parent quest_id."""
         tags = await client_tag_list.client_tags()
-        for tag in tags:
-            cursor.execute('INSERT INTO goal_client_tags (quest_id, goal_id, tag) VALUES (?, ?, ?)',
-                           (str(parent_quest_id), str(parent_goal_id), tag))
-
-    async def log_madlib(self, client: Client, madlib: MadlibArg, parent_goal_id: int, parent_quest_id: int):
-        """Logs a MadlibArg object to the database, including the parent quest_id."""
-        cursor = self.conn.cursor()
+        return [(str(parent_quest_id), str(parent_goal_id), tag) for tag in tags]
 
+    async def _madlib_row(self, client: Client, madlib: MadlibArg, parent_goal_id: int, parent_quest_id: int) -> tuple:
+        """Reads a MadlibArg object as a madlibs row, including the parent quest_id."""
         identifier = await Utils.translate_lang_key(client, await madlib.identifier())
         raw_value = await madlib.maybe_data_str()
         final_value = await Utils.translate_lang_key(client, raw_value)
 
-        cursor.execute('INSERT INTO madlibs (quest_id, goal_id, identifier, final_value) VALUES (?, ?, ?, ?)',
-                       (str(parent_quest_id), str(parent_goal_id), identifier, final_value or "Empty"))
+        return str(parent_quest_id), str(parent_goal_id), identifier, final_value or "Empty"
 
     def close(self):
         """Closes the database connection."""
@@ -603,10 +603,23 @@ async def _setup_export_paths(client: Client) -> tuple[Path, str]:
     return output_file_path, sane_zone_name
 
 
-async def _load_and_build_collision_geometry(client: Client, z_slice: float, debug: bool = False) -> tuple[
+async def _load_and_build_collision_geometry(client: Client, z_slice: float, debug: bool = False,
+                                             geometry_cache: dict = None) -> tuple[
     CollisionWorld, List[Polygon], List[Polygon]]:
-    """Loads raw collision data and builds 2D polygon shapes for static geometry."""
-    
+    """Loads raw collision data and builds 2D polygon shapes for static geometry.
+
+    If geometry_cache is given, results are memoized in it by (zone name, z slice) so repeated
+    teleports within the same zone skip reading and parsing the collision files.
+    """
+    if geometry_cache is not None:
+        cache_key = (await client.zone_name(), z_slice)
+        if cache_key in geometry_cache:
+            logger.info("Reusing collision geometry built earlier for this zone")
+            return geometry_cache[cache_key]
+        geometry = await _load_and_build_collision_geometry(client, z_slice, debug)
+        geometry_cache[cache_key] = geometry
+        return geometry
+
     # Try to load cached collision data first
     try:
         cache_dir = await get_cache_directory(client)
@@ -1166,11 +1179,14 @@ async def WorldsCollideTP(
         player_radius_offset: float = 1,
         static_body_radius: float = 75.0,
         plots: bool = True,
-        debug: bool = True
+        debug: bool = True,
+        geometry_cache: dict = None
 ):
     """
     Handles teleportation to a quest target by calculating a safe path around ALL collision geometry,
     including dynamic entities.
+
+    Pass the same geometry_cache dict across calls to reuse the static zone geometry between retries.
     """
     output_file_path, sane_zone_name = await _setup_export_paths(client)
     player_pos = await client.body.position()
@@ -1181,7 +1197,8 @@ async def WorldsCollideTP(
     logger.info(f"Quest target: {target}")
     logger.info(f"Quest ID: {quest_id}")
 
-    world, static_coll_shapes, mesh_shapes = await _load_and_build_collision_geometry(client, target.z, debug)
+    world, static_coll_shapes, mesh_shapes = await _load_and_build_collision_geometry(
+        client, target.z, debug, geometry_cache)
     
     # Get player height early for height-aware collision detection
     player_height = await client.body.height()
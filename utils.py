@@ -72,6 +72,16 @@ async def get_window_from_path(root_window: Window, name_path: list[str]) -> Win
     return await _recurse_follow_path(root_window, name_path)
 
 
+async def get_window_from_path_or_none(root_window: Window, name_path: list[str]) -> Optional[Window]:
+    # get_window_from_path signals a missing window with False, normalise that to None for callers.
+    # The walk reads children/names from memory, which can fail mid loading screen or UI rebuild; treat that as missing too
+    try:
+        window = await get_window_from_path(root_window, name_path)
+    except (ValueError, wizwalker.errors.MemoryReadError):
+        return None
+    return window or None
+
+
 async def is_visible_by_path(client: Client, path: list[str]):
     # FULL CREDIT TO SIROLAF FOR THIS FUNCTION
     # checks visibility of a window from the path